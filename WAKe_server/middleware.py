@@ -1,21 +1,74 @@
+import datetime
+from typing import Optional
+
 from django.core.handlers.wsgi import WSGIRequest
 from django.utils.deprecation import MiddlewareMixin
 from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import SlidingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from accounts.tokens import CachedSlidingToken
+
+# token 재발급(서명 + outstanding token insert)을 하지 않는 경로
+JWT_COOKIE_SKIP_PATHS = ('/mvp/', '/static/', '/favicon.ico')
+# 남은 유효기간이 이보다 짧을 때만 새 token 발급
+JWT_REISSUE_BEFORE = datetime.timedelta(days=7)
 
 
 class CustomAuthenticationMiddleware(MiddlewareMixin):
 
+    def get_incoming_token(self, request: WSGIRequest) -> Optional[SlidingToken]:
+        """
+        drf 인증에 사용된 token, 없으면 jwt cookie의 token (유효하고 같은 user의 것만)
+        """
+        token = getattr(request, 'auth', None)
+        if isinstance(token, SlidingToken):
+            return token
+
+        cookie = request.COOKIES.get('jwt')
+        if not cookie:
+            return None
+        try:
+            token = CachedSlidingToken(cookie)
+        except TokenError:
+            return None
+        user_id = getattr(request.user, api_settings.USER_ID_FIELD)
+        if str(token.get(api_settings.USER_ID_CLAIM)) != str(user_id):
+            return None
+        return token
+
+    @staticmethod
+    def remaining_lifetime(token: SlidingToken) -> datetime.timedelta:
+        expires_at = datetime_from_epoch(min(token['exp'], token[api_settings.SLIDING_TOKEN_REFRESH_EXP_CLAIM]))
+        return expires_at - token.current_time
+
+    def needs_reissue(self, token: SlidingToken) -> bool:
+        return self.remaining_lifetime(token) < JWT_REISSUE_BEFORE
+
     def set_jwt_cookie(self, request: WSGIRequest, response: Response):
+        if request.path.startswith(JWT_COOKIE_SKIP_PATHS):
+            return response
+
         if request.user.is_authenticated:
-            jwt = SlidingToken.for_user(request.user)
+            token = self.get_incoming_token(request)
+            if token is None or self.needs_reissue(token):
+                token = CachedSlidingToken.for_user(request.user)
+                jwt = str(token)
+            else:
+                jwt = str(token)
+                if request.COOKIES.get('jwt') == jwt:
+                    # 이미 같은 token이 cookie에 있으면 Set-Cookie 생략 (cookie는 token과 같이 만료되도록 설정됨)
+                    return response
+
             origin = request.headers.get('origin')
             is_local = False if origin is None or 'localhost' not in origin else True
             domain = None if is_local else '.zps.kr'
             response.set_cookie(
                 'jwt',
-                str(jwt),
-                max_age=3600 * 24 * 3,
+                jwt,
+                max_age=int(self.remaining_lifetime(token).total_seconds()),
                 domain=domain,
                 secure=(not is_local),
                 httponly=True,
@@ -0,0 +1,89 @@
+import dataclasses
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 drf 기본 json으로 동작
+    orjson = None
+
+
+def dto_to_dict(obj):
+    if hasattr(obj, 'dto_fields'):
+        return obj.field_to_dict()
+    return dataclasses.asdict(obj)
+
+
+class DTOJSONEncoder(JSONEncoder):
+    """
+    drf JSONEncoder + dtos.base의 dataclass DTO
+    """
+
+    def default(self, obj):
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return dto_to_dict(obj)
+        return super().default(obj)
+
+
+_encoder = DTOJSONEncoder()
+
+
+def _orjson_default(obj):
+    # orjson이 직접 처리하지 못하는 type (Decimal, lazy str, DTO 등)은 drf encoder 규칙을 따른다.
+    return _encoder.default(obj)
+
+
+_ORJSON_OPTIONS = 0
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson이 설치되어 있으면 orjson으로, 아니면 drf JSONRenderer로 render
+    - datetime은 drf와 같이 ISO 8601 + UTC는 Z
+    - ReturnDict / ReturnList는 dict / list subclass이므로 그대로 처리
+    - DTO는 dto_fields만 dict로 변환
+    """
+    encoder_class = DTOJSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context) is not None:
+            # orjson은 indent 2만 지원하므로 browsable api 등 indent 요청은 drf에 맡김
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_orjson_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # 64bit를 넘는 int 등 orjson이 처리하지 못하는 값은 drf JSONRenderer로
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # drf JSONRenderer와 같이 \u2028, \u2029는 escape
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class FastJSONParser(JSONParser):
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or encoding.lower().replace('-', '') != 'utf8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
@@ -9,6 +9,7 @@ https://docs.djangoproject.com/en/5.0/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -55,6 +56,7 @@ THIRD_PARTY_APPS = [
 PROJECT_APPS = [
     "accounts",
     "records",
+    "jobs",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + PROJECT_APPS
@@ -126,6 +128,32 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 ROOT_URLCONF = "WAKe_server.urls"
 
+# local / test용 process 단위 local memory cache
+# uwsgi process 여러 개로 배포하는 settings(dev)에서는 process 간 공유되는 redis cache 사용
+# (timeline / catalog version / content deck 등을 지우거나 바꾼 내용이 모든 process에 보여야 하므로)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+        },
+    },
+    "loggers": {
+        # timeline cache hit/miss 주기적 집계 (records.cache)
+        "records.cache": {
+            "handlers": ["console"],
+            "level": "INFO",
+        },
+    },
+}
+
 CORS_ALLOW_CREDENTIALS = True
 CORS_ORIGIN_ALLOW_ALL = True
 
@@ -155,14 +183,24 @@ ACCOUNT_USERNAME_REQUIRED = False
 ACCOUNT_AUTHENTICATION_METHOD = 'email'
 ACCOUNT_EMAIL_VERIFICATION = 'none'
 
-# jwt 토큰은 simplejwt의 JWTAuthentication으로 인증한다.
+# jwt 토큰은 simplejwt의 JWTAuthentication으로 인증한다. (user는 process 단위 cache에서 조회)
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.AllowAny',  # 누구나 접근
     ),
+    # orjson이 설치되어 있으면 orjson으로 render / parse
+    'DEFAULT_RENDERER_CLASSES': (
+        'WAKe_server.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'WAKe_server.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
@@ -180,5 +218,9 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_REFRESH_EXP_CLAIM': 'refresh_exp',
     'UPDATE_LAST_LOGIN': True,
     'USER_ID_FIELD': 'email',
-    'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.SlidingToken',)
+    'AUTH_TOKEN_CLASSES': ('accounts.tokens.CachedSlidingToken',)  # blacklist는 process 단위 index로 확인
 }
+
+# kakao api host (local stub server를 사용할 때 환경변수로 변경, social_app/kakao_stub.py 참고)
+KAKAO_AUTH_HOST = os.environ.get('KAKAO_AUTH_HOST', 'https://kauth.kakao.com')
+KAKAO_API_HOST = os.environ.get('KAKAO_API_HOST', 'https://kapi.kakao.com')
@@ -14,6 +14,14 @@ DATABASES = {
     }
 }
 
+# uwsgi process 간 공유되는 in-memory cache (docker-compose의 redis service)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': get_secrets('REDIS_URL'),
+    }
+}
+
 AWS_S3_CUSTOM_DOMAIN = get_secrets('AWS_S3_CUSTOM_DOMAIN')
 AWS_STORAGE_BUCKET_NAME = get_secrets('AWS_STORAGE_BUCKET_NAME')
 AWS_REGION = get_secrets('AWS_REGION')
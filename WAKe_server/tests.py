@@ -0,0 +1,50 @@
+import datetime
+import decimal
+import uuid
+from dataclasses import dataclass, field
+
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from dtos.base import BaseOutputDTO
+from WAKe_server.renderers import DTOJSONEncoder, FastJSONRenderer
+
+
+@dataclass
+class RendererTestDTO(BaseOutputDTO):
+    id: int
+    name: str
+
+    dto_name: str = field(default='renderer_test', init=False)
+
+
+class DRFJSONRenderer(JSONRenderer):
+    # orjson 없이 drf json + DTO encoder로 render (FastJSONRenderer의 fallback과 같은 결과)
+    encoder_class = DTOJSONEncoder
+
+
+class FastJSONRendererTest(SimpleTestCase):
+    def assert_same_as_drf(self, data):
+        self.assertEqual(FastJSONRenderer().render(data), DRFJSONRenderer().render(data))
+
+    def test_parity(self):
+        self.assert_same_as_drf(ReturnDict({
+            'id': 1,
+            'text': '한글 \u2028 "quote"',
+            'score': 1.5,
+            'none': None,
+            'flags': [True, False],
+            'created_at': datetime.datetime(2024, 7, 2, 1, 2, 3, 456789, tzinfo=datetime.timezone.utc),
+            'date': datetime.date(2024, 7, 2),
+            'records': ReturnList([{'id': 2}], serializer=None),
+        }, serializer=None))
+        self.assert_same_as_drf([decimal.Decimal('1.10'), uuid.UUID(int=1)])
+        self.assert_same_as_drf({'dto': RendererTestDTO(id=1, name='a')})
+
+    def test_big_int(self):
+        # orjson은 64bit를 넘는 int를 처리하지 못하므로 drf로 fallback
+        self.assert_same_as_drf({'id': 2 ** 64, 'ids': [-2 ** 63 - 1]})
+
+    def test_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
@@ -0,0 +1,109 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+USER_CACHE_VERSION_KEY = 'accounts:user_cache:version:{user_pk}'
+USER_CACHE_MAX_SIZE = 1024
+# cache가 process 단위(locmem)인 경우 다른 process의 변경은 TTL이 지나야 반영됨
+USER_CACHE_TTL = 60
+
+
+class UserCache:
+    """
+    process 단위 LRU + TTL 인증 user cache (key: USER_ID_FIELD 값)
+    User 저장/삭제, 탈퇴 시 cache의 user별 version을 올려서 다음 인증 때 다시 불러옵니다.
+    hit 때마다 version key를 확인하므로 배포 settings처럼 cache가 redis(in-memory)여야 DB 조회가 없습니다.
+    """
+
+    def __init__(self, max_size: int = USER_CACHE_MAX_SIZE, ttl: int = USER_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._users = OrderedDict()  # user_id -> (pk, version, loaded_at, user)
+        self._keys = {}  # pk -> user_id
+
+    @staticmethod
+    def _version_key(user_pk) -> str:
+        return USER_CACHE_VERSION_KEY.format(user_pk=user_pk)
+
+    def get(self, user_id):
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+
+        pk, version, loaded_at, user = entry
+        if time.monotonic() - loaded_at >= self.ttl or cache.get(self._version_key(pk), 0) != version:
+            self.discard(pk)
+            return None
+
+        with self._lock:
+            if user_id in self._users:
+                self._users.move_to_end(user_id)
+        # 여러 thread가 같은 instance의 fields_cache 등을 건드리지 않도록 복사본을 return
+        return copy.copy(user)
+
+    def get_version(self, user_pk) -> int:
+        return cache.get(self._version_key(user_pk), 0)
+
+    def set(self, user_id, user, version: int):
+        with self._lock:
+            old_key = self._keys.get(user.pk)
+            if old_key is not None and old_key != user_id:
+                self._users.pop(old_key, None)
+            self._users[user_id] = (user.pk, version, time.monotonic(), copy.copy(user))
+            self._users.move_to_end(user_id)
+            self._keys[user.pk] = user_id
+            while len(self._users) > self.max_size:
+                _, (pk, *_) = self._users.popitem(last=False)
+                self._keys.pop(pk, None)
+
+    def discard(self, user_pk):
+        with self._lock:
+            user_id = self._keys.pop(user_pk, None)
+            if user_id is not None:
+                self._users.pop(user_id, None)
+
+    def invalidate(self, user_pk):
+        self.discard(user_pk)
+        try:
+            cache.incr(self._version_key(user_pk))
+        except ValueError:
+            cache.set(self._version_key(user_pk), 1, None)
+
+    async def ainvalidate(self, user_pk):
+        self.discard(user_pk)
+        try:
+            await cache.aincr(self._version_key(user_pk))
+        except ValueError:
+            await cache.aset(self._version_key(user_pk), 1, None)
+
+    def clear(self):
+        with self._lock:
+            self._users.clear()
+            self._keys.clear()
+
+
+user_cache = UserCache()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication + process 단위 user cache
+    cache hit인 경우 user 조회 query 없이 (공유 cache의 version key 조회 한 번으로) 인증합니다.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None:
+            user = user_cache.get(user_id)
+            if user is not None:
+                return user
+
+        user = super().get_user(validated_token)
+        user_cache.set(user_id, user, user_cache.get_version(user.pk))
+        return user
@@ -0,0 +1,30 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.tokens import TOKEN_COMPACTION_BATCH_SIZE, compact_expired_tokens
+
+
+class Command(BaseCommand):
+    help = '만료된 OutstandingToken / BlacklistedToken을 batch 단위로 삭제 (cron 등으로 주기적으로 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=TOKEN_COMPACTION_BATCH_SIZE)
+        parser.add_argument('--pause', type=float, default=0.0, help='batch 사이에 쉬는 시간 (초)')
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        total_outstanding = total_blacklisted = 0
+        for first_id, last_id, outstanding, blacklisted, seconds in compact_expired_tokens(
+            options['batch_size'], options['pause']
+        ):
+            total_outstanding += outstanding
+            total_blacklisted += blacklisted
+            self.stdout.write(
+                f'id {first_id}-{last_id}: {outstanding} outstanding, {blacklisted} blacklisted '
+                f'deleted in {seconds * 1000:.1f} ms'
+            )
+        self.stdout.write(
+            f'total: {total_outstanding} outstanding, {total_blacklisted} blacklisted '
+            f'deleted in {time.monotonic() - started:.2f} s'
+        )
@@ -0,0 +1,154 @@
+import threading
+import time
+
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import SlidingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from accounts.models import CommonProfile
+
+# 다른 process에서 blacklist 된 token은 최대 이 시간 뒤에 반영됨
+BLACKLIST_SYNC_INTERVAL = 10
+# 만료된 jti를 정리하고 누락분을 채우기 위해 주기적으로 전체를 다시 불러옴
+BLACKLIST_FULL_SYNC_INTERVAL = 60 * 60
+# 기록 생성 시 profile 조회 없이 사용하는 CommonProfile id claim
+PROFILE_ID_CLAIM = 'profile_id'
+# 만료 token 정리 시 한 번에 훑는 OutstandingToken id 범위
+TOKEN_COMPACTION_BATCH_SIZE = 1000
+
+
+class BlacklistIndex:
+    """
+    process 단위로 들고 있는 blacklist jti set
+    BLACKLIST_SYNC_INTERVAL마다 마지막으로 읽은 BlacklistedToken.id 이후만 추가로 불러옵니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jtis = frozenset()
+        self._last_id = None
+        self._synced_at = None
+        self._full_synced_at = None
+
+    def _sync(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._synced_at is not None and now - self._synced_at < BLACKLIST_SYNC_INTERVAL:
+                return
+
+            if self._full_synced_at is None or now - self._full_synced_at >= BLACKLIST_FULL_SYNC_INTERVAL:
+                rows = BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+                jtis = set()
+                self._full_synced_at = now
+            else:
+                rows = BlacklistedToken.objects.filter(id__gt=self._last_id)
+                jtis = set(self._jtis)
+
+            last_id = self._last_id or 0
+            for pk, jti in rows.order_by('id').values_list('id', 'token__jti'):
+                jtis.add(jti)
+                last_id = max(last_id, pk)
+            self._jtis = frozenset(jtis)
+            self._last_id = last_id
+            self._synced_at = now
+
+    def contains(self, jti: str) -> bool:
+        if self._synced_at is None or time.monotonic() - self._synced_at >= BLACKLIST_SYNC_INTERVAL:
+            self._sync()
+        return jti in self._jtis
+
+    def add(self, jti: str):
+        with self._lock:
+            self._jtis = self._jtis | {jti}
+
+    def clear(self):
+        with self._lock:
+            self._jtis = frozenset()
+            self._last_id = None
+            self._synced_at = None
+            self._full_synced_at = None
+
+
+blacklist_index = BlacklistIndex()
+
+
+class CachedSlidingToken(SlidingToken):
+    """
+    SlidingToken + process 단위 blacklist index + profile id claim
+    인증할 때마다 BlacklistedToken을 조회하지 않고 blacklist_index로 확인합니다.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        # OutstandingToken에는 claim 추가 전의 token 문자열이 저장되지만 blacklist는 jti로만 확인하므로 무관
+        token = super().for_user(user)
+        profile_id = CommonProfile.objects.filter(user_id=user.pk).values_list('id', flat=True).first()
+        if profile_id is not None:
+            token[PROFILE_ID_CLAIM] = profile_id
+        return token
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if blacklist_index.contains(jti):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        blacklisted = super().blacklist()
+        blacklist_index.add(self.payload[api_settings.JTI_CLAIM])
+        return blacklisted
+
+    async def ablacklist(self):
+        """
+        blacklist의 async ORM 버전 (ASGI view용)
+        """
+        jti = self.payload[api_settings.JTI_CLAIM]
+        token, _ = await OutstandingToken.objects.aget_or_create(
+            jti=jti,
+            defaults={
+                'token': str(self),
+                'expires_at': datetime_from_epoch(self.payload['exp']),
+            },
+        )
+        blacklisted = await BlacklistedToken.objects.aget_or_create(token=token)
+        blacklist_index.add(jti)
+        return blacklisted
+
+
+def compact_expired_tokens(batch_size: int = TOKEN_COMPACTION_BATCH_SIZE, pause: float = 0.0):
+    """
+    만료된 OutstandingToken / BlacklistedToken을 id 범위 batch_size씩 삭제하고
+    batch마다 (첫 id, 마지막 id, 삭제한 outstanding 수, 삭제한 blacklisted 수, 걸린 초)를 yield
+    - expires_at에는 index가 없으므로 pk 범위로 끊어서 batch마다 짧은 transaction으로 삭제
+    - sliding token은 lifetime이 같아 id 순서로 만료되므로, 만료 안 된 token만 있는 범위가 나오면 종료
+    """
+    now = timezone.now()
+    bounds = OutstandingToken.objects.aggregate(first_id=Min('id'), last_id=Max('id'))
+    if bounds['first_id'] is None:
+        return
+
+    for start in range(bounds['first_id'], bounds['last_id'] + 1, batch_size):
+        started = time.monotonic()
+        window = OutstandingToken.objects.filter(id__gte=start, id__lt=start + batch_size)
+        with transaction.atomic():
+            ids = list(window.filter(expires_at__lte=now).order_by('id').values_list('id', flat=True))
+            if not ids:
+                if window.exists():
+                    return
+                continue
+            # BlacklistedToken은 cascade로 같이 삭제, token 본문은 읽지 않도록 id만 불러옴
+            _, deleted = OutstandingToken.objects.filter(id__in=ids).only('id').delete()
+        yield (
+            start,
+            start + batch_size - 1,
+            deleted.get(OutstandingToken._meta.label, 0),
+            deleted.get(BlacklistedToken._meta.label, 0),
+            time.monotonic() - started,
+        )
+        if pause:
+            time.sleep(pause)
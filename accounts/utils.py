@@ -1,10 +1,24 @@
-from rest_framework_simplejwt.tokens import SlidingToken
+from rest_framework_simplejwt.tokens import Token
+
+from accounts.models import CommonProfile
+from accounts.tokens import CachedSlidingToken, PROFILE_ID_CLAIM
 
 
 def token_serializer(user):
-    jwt_token = SlidingToken.for_user(user)
+    jwt_token = CachedSlidingToken.for_user(user)
     rtn = dict(
         access=str(jwt_token),
         refresh=str(jwt_token)
     )
     return rtn
+
+
+def get_profile_id(request) -> int:
+    """
+    인증된 token의 profile id claim, 이전에 발급된 token이면 user로 CommonProfile 조회
+    """
+    if isinstance(request.auth, Token):
+        profile_id = request.auth.get(PROFILE_ID_CLAIM)
+        if profile_id is not None:
+            return profile_id
+    return CommonProfile.objects.filter(user_id=request.user.pk).values_list('id', flat=True).get()
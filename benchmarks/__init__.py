@@ -0,0 +1,44 @@
+"""
+python -m benchmarks.<module> 으로 실행하는 성능 측정 스크립트 모음
+"""
+import os
+import timeit
+from contextlib import contextmanager
+
+
+def setup_django():
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "WAKe_server.settings")
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    """
+    실제 DB를 건드리지 않도록 test DB를 만들고, 끝나면 삭제
+    """
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(func, number: int = 100, repeat: int = 5) -> float:
+    """
+    func 1회 실행 시간(sec)의 best of repeat
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(name: str, seconds: float, baseline: float = None):
+    line = f'{name:<40} {seconds * 1e6:>12.1f} us'
+    if baseline:
+        line += f'  (x{baseline / seconds:.2f})'
+    print(line)
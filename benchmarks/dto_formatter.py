@@ -0,0 +1,219 @@
+"""
+DTOFormatter.run / DTOChecker.run / DTO 생성 시간 (중첩 list DTO)
+- page: BenchPageDTO 하나에 record --records개, record마다 tag --tags개
+- DTOFormatter는 payload를 매번 json.loads로 새로 만듦 (json.loads만 한 시간도 같이 출력)
+- DTOChecker는 같은 payload를 반복 검사
+- legacy: validator plan 이전 구현 (재귀 try/except + field마다 typeguard check_type)을 같이 측정
+  이전 코드는 typeguard 2의 check_type(name, value, type)을 호출해서 4.x에서는 TypeError가 나므로
+  check_type(value, type)으로만 바꿔서 실행
+
+    python -m benchmarks.dto_formatter --records 100 --tags 5
+"""
+import argparse
+import copy
+import json
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Union, get_args, get_origin
+
+from typeguard import check_type
+
+from benchmarks import setup_django, measure, report
+
+
+def define_dtos():
+    from dtos.base import BaseOutputDTO
+
+    @dataclass
+    class BenchTagDTO(BaseOutputDTO):
+        id: int
+        name: str
+
+        dto_name: str = field(default='bench_tag', init=False)
+
+    @dataclass
+    class BenchRecordDTO(BaseOutputDTO):
+        id: int
+        text: Optional[str]
+        score: Union[int, float]
+        tags: List[BenchTagDTO]
+        extra: Optional[dict] = None
+
+        dto_name: str = field(default='bench_record', init=False)
+
+    @dataclass
+    class BenchPageDTO(BaseOutputDTO):
+        results: List[BenchRecordDTO]
+        count: int
+        next: Optional[str] = None
+
+        dto_name: str = field(default='bench_page', init=False)
+
+    return BenchTagDTO, BenchRecordDTO, BenchPageDTO
+
+
+def build_payload(records: int, tags: int) -> str:
+    return json.dumps({
+        'results': [
+            {
+                'id': i,
+                'text': None if i % 3 == 0 else f'record {i}',
+                'score': i if i % 2 else i / 2,
+                'tags': [{'id': j, 'name': f'tag {j}'} for j in range(tags)],
+                'extra': {'source': 'bench'} if i % 5 == 0 else None,
+            }
+            for i in range(records)
+        ],
+        'count': records,
+        'next': None,
+    })
+
+
+def legacy_post_init(self):
+    for field_name, field_type in self.dto_fields.items():
+        check_type(getattr(self, field_name), field_type)
+
+
+@contextmanager
+def legacy_dtos():
+    """
+    측정하는 동안 BaseDTO.__post_init__을 이전 구현으로 교체
+    """
+    from dtos.base import BaseDTO
+
+    post_init = BaseDTO.__post_init__
+    BaseDTO.__post_init__ = legacy_post_init
+    try:
+        yield
+    finally:
+        BaseDTO.__post_init__ = post_init
+
+
+def legacy_format(dto, dto_class):
+    """
+    이전 DTOFormatter.run: 맞는 type을 찾을 때까지 재귀로 변환을 시도하고 dto를 그 자리에서 바꿈
+    """
+    from dtos import DICT_TYPE, LIST_TYPE
+    from dtos.base import DTOFormatter
+
+    if dto_class == Any:
+        return dto
+    elif type(dto) in DICT_TYPE:
+        for field_name, field_value in dto.items():
+            if type(field_value) in DICT_TYPE:
+                child_value_ok = False
+                try:
+                    child_dto_class = dto_class.dto_fields.get(field_name)
+                except AttributeError:
+                    child_dto_class = dto_class[field_name]
+                if child_dto_class == Any:
+                    child_value_ok = True
+                elif get_origin(child_dto_class) == Union:
+                    for tp_arg in get_args(child_dto_class):
+                        try:
+                            dto[field_name] = legacy_format(field_value, tp_arg)
+                            child_value_ok = True
+                            break
+                        except Exception:
+                            pass
+                else:
+                    try:
+                        dto[field_name] = legacy_format(field_value, child_dto_class)
+                        child_value_ok = True
+                    except Exception:
+                        pass
+                if not child_value_ok:
+                    raise Exception(f'child_type does not match. : {field_value}')
+            elif type(field_value) in LIST_TYPE and field_value:
+                try:
+                    tp = dto_class.dto_fields.get(field_name)
+                except AttributeError:
+                    tp = dto_class.__annotations__.get(field_name)
+                tp_args = DTOFormatter.extract_dto_from_List(field_name, tp)
+                rtn = []
+                for child_value in field_value:
+                    child_type_ok = False
+                    for tp in tp_args:
+                        try:
+                            rtn.append(legacy_format(child_value, tp))
+                            child_type_ok = True
+                            break
+                        except Exception:
+                            pass
+                    if not child_type_ok:
+                        raise Exception(f'child_type does not match. : {child_value}')
+                dto[field_name] = rtn
+        return dto_class(**dto)
+    elif type(dto) in LIST_TYPE:
+        return [legacy_format(arg, dto_class) for arg in dto]
+    else:
+        check_type(dto, dto_class)
+        return dto
+
+
+def legacy_check(dto, dto_class):
+    """
+    이전 DTOChecker.run: deepcopy한 뒤 legacy_format
+    """
+    legacy_format(copy.deepcopy(dto), dto_class)
+    return True
+
+
+def run(records: int, tags: int):
+    from dtos.base import DTOChecker, DTOFormatter
+    from dtos.social_app import KakaoOauthTokenOutputDTO
+
+    BenchTagDTO, BenchRecordDTO, BenchPageDTO = define_dtos()
+    raw = build_payload(records, tags)
+
+    page = DTOFormatter.run(json.loads(raw), BenchPageDTO)
+    assert isinstance(page.results[-1].tags[-1], BenchTagDTO)
+    with legacy_dtos():
+        assert legacy_format(json.loads(raw), BenchPageDTO) == page, 'output mismatch'
+
+    def kakao_token():
+        return KakaoOauthTokenOutputDTO(
+            token_type='bearer', access_token='a', expires_in=1, refresh_token='r', refresh_token_expires_in=1,
+            scope=['account_email', 'profile_nickname'],
+        )
+
+    number = max(1, 2000 // (records * (tags + 1)))
+    payload = json.loads(raw)
+    with legacy_dtos():
+        legacy = {
+            'page': measure(lambda: legacy_format(json.loads(raw), BenchPageDTO), number=number),
+            'list': measure(lambda: legacy_format(json.loads(raw)['results'], BenchRecordDTO), number=number),
+            'check': measure(lambda: legacy_check(payload, BenchPageDTO), number=number),
+            'kakao': measure(kakao_token, number=2000),
+        }
+
+    report('json.loads only', measure(lambda: json.loads(raw), number=number))
+    report(f'legacy format page ({records} x {tags})', legacy['page'])
+    report(f'DTOFormatter.run page ({records} x {tags})', measure(
+        lambda: DTOFormatter.run(json.loads(raw), BenchPageDTO), number=number
+    ), legacy['page'])
+    report(f'legacy format list[record] ({records})', legacy['list'])
+    report(f'DTOFormatter.run list[record] ({records})', measure(
+        lambda: DTOFormatter.run(json.loads(raw)['results'], BenchRecordDTO), number=number
+    ), legacy['list'])
+    report(f'legacy check page ({records} x {tags})', legacy['check'])
+    report(f'DTOChecker.run page ({records} x {tags})', measure(
+        lambda: DTOChecker.run(payload, BenchPageDTO), number=number
+    ), legacy['check'])
+    tracemalloc.start()
+    DTOChecker.run(payload, BenchPageDTO)
+    print(f'{"DTOChecker.run peak memory":<40} {tracemalloc.get_traced_memory()[1] / 1024:>12.1f} KiB')
+    tracemalloc.stop()
+    report('legacy KakaoOauthTokenOutputDTO(...)', legacy['kakao'])
+    report('KakaoOauthTokenOutputDTO(...)', measure(kakao_token, number=2000), legacy['kakao'])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=100)
+    parser.add_argument('--tags', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.records, args.tags)
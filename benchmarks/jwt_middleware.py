@@ -0,0 +1,63 @@
+"""
+CustomAuthenticationMiddleware의 request당 overhead 비교
+- before: 매 response마다 SlidingToken.for_user + Set-Cookie (기존 동작)
+- after: 유효기간이 충분한 token은 그대로 사용
+
+    python -m benchmarks.jwt_middleware
+"""
+from benchmarks import setup_django, test_database, measure, report
+
+
+def set_jwt_cookie_before(request, response):
+    from rest_framework_simplejwt.tokens import SlidingToken
+
+    jwt = SlidingToken.for_user(request.user)
+    response.set_cookie('jwt', str(jwt), max_age=3600 * 24 * 3, domain='.zps.kr', secure=True, httponly=True,
+                        samesite=False)
+    return response
+
+
+def run():
+    from django.db import connection
+    from django.http import HttpResponse
+    from django.test import RequestFactory
+    from django.test.utils import CaptureQueriesContext
+    from rest_framework_simplejwt.tokens import SlidingToken
+
+    from accounts.models import User
+    from WAKe_server.middleware import CustomAuthenticationMiddleware
+
+    user = User.objects.create_user('bench@wake.com', 'bench')
+    token = SlidingToken.for_user(user)
+    middleware = CustomAuthenticationMiddleware(lambda request: HttpResponse())
+
+    def header_request():
+        request = RequestFactory().get('/api/records/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        request.user, request.auth = user, token
+        return request
+
+    def cookie_request():
+        request = header_request()
+        request.COOKIES['jwt'] = str(token)
+        return request
+
+    cases = (
+        ('before', lambda: set_jwt_cookie_before(header_request(), HttpResponse())),
+        ('after (no jwt cookie yet)', lambda: middleware.process_response(header_request(), HttpResponse())),
+        ('after (jwt cookie already set)', lambda: middleware.process_response(cookie_request(), HttpResponse())),
+        ('request only (RequestFactory)', lambda: (header_request(), HttpResponse())),
+    )
+
+    baseline = None
+    for name, func in cases:
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        seconds = measure(func, number=200)
+        baseline = baseline or seconds
+        report(f'{name} [{len(queries)} queries]', seconds, baseline)
+
+
+if __name__ == '__main__':
+    setup_django()
+    with test_database():
+        run()
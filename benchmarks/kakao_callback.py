@@ -0,0 +1,98 @@
+"""
+kakao callback 동시 로그인 비교 (social_app.kakao_stub의 asyncio stub server, 응답 지연 --delay)
+- sync: KaKaoLoginViewSet.callback, uwsgi와 같이 thread 100개
+- async: social_app.async_views.kakao_callback, ASGI application 하나에서 coroutine으로
+
+    python -m benchmarks.kakao_callback --logins 1000 --delay 0.2
+"""
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import setup_django, test_database
+
+SYNC_THREADS = 100
+
+
+def create_users(count: int):
+    from accounts.models import User, CommonProfile
+
+    users = []
+    for i in range(count):
+        user = User(email=f'bench{i}@kakao.stub')
+        user.set_unusable_password()
+        users.append(user)
+    User.objects.bulk_create(users)
+    users = User.objects.filter(email__endswith='@kakao.stub').order_by('id')
+    CommonProfile.objects.bulk_create([CommonProfile(user=user, name=f'bench{i}') for i, user in enumerate(users)])
+
+
+def run_sync(count: int) -> tuple:
+    from django.test import Client
+
+    peak_threads = 0
+
+    def login(i):
+        nonlocal peak_threads
+        peak_threads = max(peak_threads, threading.active_count())
+        return Client().get(f'/api/social/kakao/callback/?code=bench{i}').status_code
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=SYNC_THREADS) as executor:
+        statuses = list(executor.map(login, range(count)))
+    return time.monotonic() - started, peak_threads, statuses
+
+
+def run_async(count: int) -> tuple:
+    import httpx
+    from WAKe_server.asgi import application
+
+    async def main():
+        transport = httpx.ASGITransport(app=application)
+        async with httpx.AsyncClient(transport=transport, base_url='http://testserver') as client:
+            started = time.monotonic()
+            responses = await asyncio.gather(*[
+                client.get(f'/api/social/kakao/async/callback/?code=bench{i}') for i in range(count)
+            ])
+            return time.monotonic() - started, threading.active_count(), [r.status_code for r in responses]
+
+    return asyncio.run(main())
+
+
+def run(count: int, delay: float):
+    from django.test import override_settings
+    from social_app.kakao_stub import AsyncKakaoStubServer
+
+    create_users(count)
+    stub = AsyncKakaoStubServer(delay=delay).start_background()
+    host = f'http://127.0.0.1:{stub.server_port}'
+    try:
+        with override_settings(KAKAO_AUTH_HOST=host, KAKAO_API_HOST=host):
+            for name, func in (('sync (100 threads)', run_sync), ('async (ASGI)', run_async)):
+                seconds, threads, statuses = func(count)
+                ok = sum(status == 302 for status in statuses)
+                print(f'{name:<20} {count} logins  {seconds:>7.2f} s  {count / seconds:>8.1f} logins/s  '
+                      f'threads {threads:>4}  ok {ok}')
+    finally:
+        stub.shutdown()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--logins', type=int, default=500)
+    parser.add_argument('--delay', type=float, default=0.2)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from django.db import connection
+
+    if connection.vendor == 'sqlite':
+        # in-memory test DB는 여러 thread에서 동시에 쓰면 table lock 에러가 나므로 file로 사용
+        # 쓰기는 어차피 직렬화되므로 lock 대기 시간을 늘림 (기본 5초)
+        connection.settings_dict['TEST']['NAME'] = str(settings.BASE_DIR / 'benchmark_kakao_callback.sqlite3')
+        connection.settings_dict['OPTIONS']['timeout'] = 60
+    with test_database():
+        run(args.logins, args.delay)
@@ -0,0 +1,47 @@
+"""
+RecordSerializer(many=True) vs records.projection 비교
+
+    python -m benchmarks.record_serializer
+"""
+import json
+
+from benchmarks import setup_django, test_database, measure, report
+
+SIZES = (10, 100, 1000)
+
+
+def run():
+    from accounts.models import User, CommonProfile
+    from records.models import Record, Content
+    from records.projection import project_records, records_to_representation
+    from records.serializer import RecordSerializer
+
+    user = User.objects.create_user('bench@wake.com', 'bench')
+    profile = CommonProfile.objects.create(user=user, name='bench')
+    contents = Content.objects.bulk_create([Content(text=f'question {i}') for i in range(20)])
+
+    for size in SIZES:
+        Record.objects.all().delete()
+        Record.objects.bulk_create([
+            Record(profile=profile, content=contents[i % len(contents)], text=f'answer {i}')
+            for i in range(size)
+        ])
+        queryset = Record.objects.filter(profile=profile).select_related('content').order_by('created_at', 'id')
+
+        serializer_data = RecordSerializer(queryset, many=True).data
+        projection_data = records_to_representation(project_records(queryset))
+        assert json.dumps(serializer_data) == json.dumps(projection_data), 'output mismatch'
+
+        number = max(1, 1000 // size)
+        baseline = measure(lambda: RecordSerializer(queryset.all(), many=True).data, number=number)
+        projection = measure(lambda: records_to_representation(project_records(queryset.all())), number=number)
+
+        print(f'[{size} records]')
+        report('RecordSerializer(many=True).data', baseline)
+        report('project_records + to_representation', projection, baseline)
+
+
+if __name__ == '__main__':
+    setup_django()
+    with test_database():
+        run()
@@ -0,0 +1,82 @@
+"""
+만료 token 정리 전후 token table 크기와 blacklist 조회 시간 비교
+- --tokens개 OutstandingToken 중 --expired 비율은 만료, 그중 일부는 blacklist
+- blacklist 조회: simplejwt 기본 check_blacklist (jti exists), BlacklistIndex 전체 reload
+
+    python -m benchmarks.token_compaction --tokens 200000 --expired 0.8
+"""
+import argparse
+import datetime
+import time
+import uuid
+
+from benchmarks import setup_django, test_database, measure, report
+
+INSERT_BATCH_SIZE = 5000
+
+
+def create_tokens(count: int, expired: float):
+    from django.utils import timezone
+    from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+    from accounts.models import User
+
+    user = User.objects.create_user('bench@wake.com', 'bench')
+    now = timezone.now()
+    expired_count = int(count * expired)
+    for start in range(0, count, INSERT_BATCH_SIZE):
+        tokens = []
+        for i in range(start, min(start + INSERT_BATCH_SIZE, count)):
+            # id 순서대로 만료 (sliding token lifetime이 같으므로)
+            expires_at = now + datetime.timedelta(seconds=i - expired_count)
+            tokens.append(OutstandingToken(
+                user=user, jti=uuid.uuid4().hex, token='x' * 300, created_at=expires_at, expires_at=expires_at,
+            ))
+        tokens = OutstandingToken.objects.bulk_create(tokens)
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token) for token in tokens[::10]])
+
+
+def measure_lookups(name: str):
+    from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+    from accounts.tokens import blacklist_index
+
+    jti = OutstandingToken.objects.order_by('-id').values_list('jti', flat=True).first()
+    print(f'{name}: {OutstandingToken.objects.count()} outstanding, {BlacklistedToken.objects.count()} blacklisted')
+    report('  check_blacklist (jti exists)', measure(
+        lambda: BlacklistedToken.objects.filter(token__jti=jti).exists(), number=200
+    ))
+
+    def full_sync():
+        blacklist_index.clear()
+        blacklist_index.contains(jti)
+
+    report('  BlacklistIndex full reload', measure(full_sync, number=3, repeat=3))
+
+
+def run(count: int, expired: float, batch_size: int):
+    from accounts.tokens import compact_expired_tokens
+
+    create_tokens(count, expired)
+    measure_lookups('before')
+
+    started = time.monotonic()
+    batches = list(compact_expired_tokens(batch_size))
+    slowest = max((batch[4] for batch in batches), default=0)
+    print(f'compaction: {sum(batch[2] for batch in batches)} outstanding, '
+          f'{sum(batch[3] for batch in batches)} blacklisted deleted in {len(batches)} batches, '
+          f'{time.monotonic() - started:.2f} s (slowest batch {slowest * 1000:.1f} ms)')
+
+    measure_lookups('after')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tokens', type=int, default=200000)
+    parser.add_argument('--expired', type=float, default=0.8)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    setup_django()
+    with test_database():
+        run(args.tokens, args.expired, args.batch_size)
@@ -127,6 +127,17 @@ class TimeManager:
         else:
             return today - datetime.timedelta(days=1)
 
+    @classmethod
+    def date_range_to_utc(cls, date_st: datetime.date, date_end: datetime.date) \
+            -> (datetime.datetime, datetime.datetime):
+        """
+        KST 날짜 구간 [date_st, date_end]를 created_at 비교용 UTC 구간 [st, end)로 변환
+        컬럼을 함수로 감싸지 않으므로 (profile, created_at) index range scan이 가능합니다.
+        """
+        st = cls.today(_from=date_st).astimezone(datetime.timezone.utc)
+        end = cls.today(_from=date_end, end=True).astimezone(datetime.timezone.utc)
+        return st, end
+
     @classmethod
     def get_kst_time_from_timestamp(cls, timestamp: int) -> datetime:
         return datetime.datetime.fromtimestamp(timestamp, KST)
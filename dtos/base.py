@@ -1,4 +1,3 @@
-import copy
 import typing
 from dataclasses import dataclass, field
 from typing import Union, Optional, get_origin, get_args, Any, ForwardRef, _TypedDictMeta
@@ -7,9 +6,9 @@ from drf_spectacular.plumbing import ResolvedComponent, get_openapi_type_mapping
 from drf_spectacular.types import PYTHON_TYPE_MAPPING
 from rest_framework.response import Response
 from rest_framework.serializers import BaseSerializer
-from typeguard import check_type
 
 from dtos import _DefinedDTO, DICT_TYPE, LIST_TYPE, _DTODict
+from dtos.validators import ListValidator, Mismatch, Validator, dto_plan, type_validator
 
 if typing.TYPE_CHECKING:
     from WAKe_server.settings.base_schema import DTOSchema
@@ -79,8 +78,9 @@ class BaseDTO(metaclass=DTOMeta):
         - enforce type for dto
         - 해당 필드가 지정한 필드타입이 아닌 경우 raise
         """
-        for field_name, field_type in self.dto_fields.items():
-            check_type(field_name, getattr(self, field_name), field_type)
+        mismatch = dto_plan(type(self)).check_instance(self)
+        if mismatch is not None:
+            raise mismatch.as_error()
 
     @classmethod
     def schema_render(cls, auto_schema: Optional['DTOSchema'] = None):
@@ -319,93 +319,44 @@ class DTOFormatter:
             return tp_args
         raise Exception(f'{tp_name} is not list type. : {tp}')
 
-    @classmethod
-    def _run(cls, dto, dto_class):
-        if dto_class == Any:
-            return dto
-        elif type(dto) in DICT_TYPE:
-            for field_name, field_value in dto.items():
-                if type(field_value) in DICT_TYPE:
-                    child_value_ok = False
-                    try:
-                        child_dto_class = dto_class.dto_fields.get(field_name)
-                    except AttributeError:
-                        child_dto_class = dto_class[field_name]
-                    if child_dto_class == Any:
-                        dto[field_name] = field_value
-                        child_value_ok = True
-                    elif get_origin(child_dto_class) == Union:
-                        for tp_arg in get_args(child_dto_class):
-                            try:
-                                dto[field_name] = cls._run(field_value, tp_arg)
-                                child_value_ok = True
-                                break
-                            except:
-                                pass
-                    else:
-                        try:
-                            dto[field_name] = cls._run(field_value, child_dto_class)
-                            child_value_ok = True
-                        except:
-                            pass
-                    if not child_value_ok:
-                        raise Exception(f'child_type does not match.\n'
-                                        f'parent dto: {dto_class}'
-                                        f'child: {field_value}\n'
-                                        f'expected type: {child_dto_class}')
-                elif type(field_value) in LIST_TYPE:
-                    if len(field_value) == 0:
-                        dto[field_name] = field_value
-                    else:
-                        rtn = []
-                        try:
-                            tp = dto_class.dto_fields.get(field_name)
-                        except AttributeError:
-                            tp = dto_class.__annotations__.get(field_name)
-                        tp_args = cls.extract_dto_from_List(field_name, tp)
-                        for child_value in field_value:
-                            child_type_ok = False
-                            for tp in tp_args:
-                                try:
-                                    rtn.append(cls._run(child_value, tp))
-                                    child_type_ok = True
-                                    break
-                                except Exception as e:
-                                    pass
-                            if not child_type_ok:
-                                raise Exception(f'child_type does not match.\n'
-                                                f'parent dto: {dto_class}\n'
-                                                f'child: {child_value}\n'
-                                                f'expected type: {tp_args}\n')
-                        dto[field_name] = rtn
-                else:
-                    pass
-            return dto_class(**dto)
-        elif type(dto) in LIST_TYPE:
-            rtn = []
-            for arg in dto:
-                rtn.append(cls._run(arg, dto_class))
-            return rtn
-        else:
-            check_type(str(dto_class), dto, dto_class)
-            return dto
-
     @classmethod
     def run(cls, dto, dto_class):
         """
         return dto instance from any type
+        - dto_class의 validator로 전체를 먼저 검사한 뒤 변환 (dto는 바꾸지 않음)
         """
-        return cls._run(dto, dto_class)
+        validator = cls.validator(dto, dto_class)
+        mismatch = validator.check(dto)
+        if mismatch is not None:
+            raise mismatch.as_error()
+        return validator.convert(dto)
+
+    @staticmethod
+    def validator(dto, dto_class) -> Validator:
+        """
+        dto가 list이고 dto_class가 list type이 아니면 각 원소를 dto_class로 검사 / 변환
+        """
+        validator = type_validator(dto_class)
+        if type(dto) in LIST_TYPE and not validator.accepts(type(dto)):
+            validator = ListValidator(validator)
+        return validator
 
 
 class DTOChecker:
+    @staticmethod
+    def first_mismatch(dto, dto_class) -> Optional[Mismatch]:
+        """
+        dict / list를 복사하거나 DTO로 변환하지 않고 그 자리에서 검사
+        DTOFormatter.run이 받아들이는 값이면 None, 아니면 처음으로 틀린 위치 (mismatch.path_str)
+        """
+        return DTOFormatter.validator(dto, dto_class).check(dto)
+
     @classmethod
     def run(cls, dto, dto_class):
-        dto = copy.deepcopy(dto)
-        if type(dto) in DICT_TYPE:
-            DTOFormatter.run(dto, dto_class)
-        elif type(dto) in LIST_TYPE:
-            DTOFormatter.run(dto, dto_class)
+        if type(dto) in DICT_TYPE or type(dto) in LIST_TYPE:
+            mismatch = cls.first_mismatch(dto, dto_class)
+            if mismatch is not None:
+                raise mismatch.as_error()
         elif hasattr(dto, 'dto_name'):
             assert isinstance(dto, dto_class), f'dto {dto} does not match {dto_class}'
         elif issubclass(type(dto), BaseSerializer):
@@ -414,7 +365,9 @@ class DTOChecker:
                                 f'you have to set decorator @dto_layer(f{dto_class})')
             if not getattr(dto, 'dto_class') is dto_class:
                 raise Exception(f'"{dto}" does not match with "{dto_class}"')
-            DTOFormatter.run(dto.data, dto_class)
+            mismatch = cls.first_mismatch(dto.data, dto_class)
+            if mismatch is not None:
+                raise mismatch.as_error()
             raise Exception(f'Serializer instance does not accept although type check passed...\n'
                             f'plz, use dto.data or serializer.data')
         else:
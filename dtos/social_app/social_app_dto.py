@@ -29,3 +29,20 @@ class KakaoChannelRelationOutputDTO(BaseOutputDTO):
     state: bool
 
     dto_name: str = field(default='kakao_channel_relation', init=False)
+
+
+@dataclass
+class KakaoUserOutputDTO(BaseOutputDTO):
+    id: int
+    email: Optional[str] = None
+    nickname: Optional[str] = None
+    extra_data: Optional[dict] = None  # /v2/user/me 응답 원본 (SocialAccount.extra_data)
+
+    dto_name: str = field(default='kakao_user', init=False)
+
+
+@dataclass
+class KakaoUnlinkOutputDTO(BaseOutputDTO):
+    id: int
+
+    dto_name: str = field(default='kakao_unlink', init=False)
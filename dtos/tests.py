@@ -0,0 +1,163 @@
+import copy
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, TypedDict, Union
+
+from django.test import SimpleTestCase
+from typeguard import TypeCheckError
+
+from dtos.base import BaseOutputDTO, DTOChecker, DTOFormatter
+from dtos.social_app import KakaoOauthTokenOutputDTO
+
+
+@dataclass
+class SampleTagDTO(BaseOutputDTO):
+    id: int
+    name: str
+
+    dto_name: str = field(default='sample_tag', init=False)
+
+
+@dataclass
+class SampleCodeDTO(BaseOutputDTO):
+    code: str
+
+    dto_name: str = field(default='sample_code', init=False)
+
+
+class SamplePoint(TypedDict):
+    x: int
+    y: float
+
+
+@dataclass
+class SampleRecordDTO(BaseOutputDTO):
+    id: int
+    tags: List[SampleTagDTO]
+    pick: Union[SampleTagDTO, SampleCodeDTO, None]
+    score: Union[int, float] = 0
+    extra: Optional[dict] = None
+    point: Optional[SamplePoint] = None
+    tag_map: Dict[str, SampleTagDTO] = field(default_factory=dict)
+
+    dto_name: str = field(default='sample_record', init=False)
+
+
+def record_payload(**kwargs) -> dict:
+    return dict({'id': 1, 'tags': [{'id': 1, 'name': 'a'}], 'pick': None}, **kwargs)
+
+
+class DTOFormatterTest(SimpleTestCase):
+    def test_valid_payload(self):
+        payload = record_payload(
+            score=1.5, extra={'a': {'b': 1}}, point={'x': 1, 'y': 2}, tag_map={'k': {'id': 2, 'name': 'b'}},
+        )
+        record = DTOFormatter.run(payload, SampleRecordDTO)
+
+        self.assertIsInstance(record, SampleRecordDTO)
+        self.assertEqual(record.tags, [SampleTagDTO(1, 'a')])
+        self.assertEqual(record.tag_map, {'k': SampleTagDTO(2, 'b')})
+        self.assertEqual((record.score, record.extra, record.point), (1.5, {'a': {'b': 1}}, {'x': 1, 'y': 2}))
+        self.assertEqual(record.dto_name, 'sample_record')
+
+        # 생략한 field는 default, default_factory는 매번 새로 만듦
+        first = DTOFormatter.run(record_payload(tags=[]), SampleRecordDTO)
+        second = DTOFormatter.run(record_payload(tags=[]), SampleRecordDTO)
+        self.assertEqual((first.score, first.extra, first.tag_map), (0, None, {}))
+        self.assertIsNot(first.tag_map, second.tag_map)
+
+        # list payload는 원소마다 dto_class로 변환
+        tags = [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}]
+        self.assertEqual(DTOFormatter.run(tags, SampleTagDTO), [SampleTagDTO(1, 'a'), SampleTagDTO(2, 'b')])
+        self.assertEqual(DTOFormatter.run(tags, List[SampleTagDTO]), [SampleTagDTO(1, 'a'), SampleTagDTO(2, 'b')])
+        self.assertTrue(DTOChecker.run(payload, SampleRecordDTO))
+
+    def test_invalid_payload(self):
+        cases = [
+            (record_payload(tags=[{'id': 1, 'name': 'a'}, {'id': 'x', 'name': 'b'}]), 'tags[1].id'),
+            (record_payload(tags=[{'id': 1}]), 'tags[0].name'),
+            (record_payload(tags={}), 'tags'),
+            (record_payload(pick={'zzz': 1}), 'pick.zzz'),
+            (record_payload(score='a'), 'score'),
+            (record_payload(point={'x': 1}), 'point.y'),
+            (record_payload(tag_map={'k': {'id': 1, 'name': 2}}), 'tag_map.k.name'),
+            (record_payload(nope=1), 'nope'),
+            (record_payload(dto_name='x'), 'dto_name'),
+            ({'id': 1, 'tags': []}, 'pick'),
+        ]
+        for payload, path in cases:
+            with self.subTest(path=path):
+                with self.assertRaises(TypeCheckError) as ctx:
+                    DTOFormatter.run(payload, SampleRecordDTO)
+                self.assertTrue(str(ctx.exception).startswith(path), str(ctx.exception))
+                self.assertTrue(DTOChecker.first_mismatch(payload, SampleRecordDTO).path_str.startswith(path))
+                with self.assertRaises(TypeCheckError):
+                    DTOChecker.run(payload, SampleRecordDTO)
+
+        payloads = [record_payload(), record_payload(id=2, tags=[{'id': 1}])]
+        mismatch = DTOChecker.first_mismatch(payloads, SampleRecordDTO)
+        self.assertEqual(mismatch.path, (1, 'tags', 0, 'name'))
+        self.assertEqual(mismatch.path_str, '[1].tags[0].name')
+
+    def test_union_dispatch(self):
+        def pick(value):
+            return DTOFormatter.run(record_payload(pick=value), SampleRecordDTO).pick
+
+        # 선언 순서대로 받아들일 수 있는 첫 type으로 변환
+        self.assertEqual(pick({'id': 1, 'name': 'z'}), SampleTagDTO(1, 'z'))
+        self.assertEqual(pick({'code': 'x'}), SampleCodeDTO('x'))
+        self.assertIsNone(pick(None))
+
+        for score in (1, 1.5):
+            record = DTOFormatter.run(record_payload(score=score), SampleRecordDTO)
+            self.assertEqual((type(record.score), record.score), (type(score), score))
+        self.assertIsNone(DTOFormatter.run(record_payload(extra=None), SampleRecordDTO).extra)
+
+    def test_payload_not_mutated(self):
+        payloads = [
+            record_payload(pick={'code': 'x'}, tag_map={'k': {'id': 2, 'name': 'b'}}),
+            [record_payload(), record_payload(tags=[{'id': 'x', 'name': 'b'}])],
+        ]
+        for payload in payloads:
+            before = copy.deepcopy(payload)
+            try:
+                DTOFormatter.run(payload, SampleRecordDTO)
+            except TypeCheckError:
+                pass
+            DTOChecker.first_mismatch(payload, SampleRecordDTO)
+            self.assertEqual(payload, before)
+
+        # 변환 결과는 새 DTO이고, 원래 dict는 dict로 남음
+        payload = payloads[0]
+        record = DTOFormatter.run(payload, SampleRecordDTO)
+        self.assertIsInstance(payload['tags'][0], dict)
+        self.assertIsInstance(payload['pick'], dict)
+        self.assertIsInstance(payload['tag_map']['k'], dict)
+        self.assertIsInstance(record.tag_map['k'], SampleTagDTO)
+
+
+class DTOInstanceCheckTest(SimpleTestCase):
+    def test_post_init(self):
+        KakaoOauthTokenOutputDTO('bearer', 'a', 1, 'r', 1, ['x'])
+        with self.assertRaises(TypeCheckError) as ctx:
+            KakaoOauthTokenOutputDTO('bearer', 'a', 1, 'r', 1, ['x', 2])
+        self.assertTrue(str(ctx.exception).startswith('scope[1]'), str(ctx.exception))
+
+        with self.assertRaises(TypeCheckError):
+            SampleTagDTO('x', 'a')
+
+    def test_dict_in_dto_field(self):
+        tag = SampleTagDTO(1, 'a')
+        SampleRecordDTO(id=1, tags=[tag], pick=tag, tag_map={'a': tag}, extra={'id': 1}, point={'x': 1, 'y': 2})
+
+        # DTO 자리에는 DTO instance만 허용 (payload와 달리 dict를 받지 않음)
+        cases = [
+            (dict(tags=[{'id': 1, 'name': 'a'}], pick=None), 'tags[0]'),
+            (dict(tags=[], pick={'id': 1, 'name': 'a'}), 'pick'),
+            (dict(tags=[], pick={'code': 'x'}), 'pick'),
+            (dict(tags=[], pick=None, tag_map={'a': {'id': 1, 'name': 'a'}}), 'tag_map.a'),
+        ]
+        for kwargs, path in cases:
+            with self.subTest(path=path):
+                with self.assertRaises(TypeCheckError) as ctx:
+                    SampleRecordDTO(id=1, **kwargs)
+                self.assertTrue(str(ctx.exception).startswith(path), str(ctx.exception))
@@ -0,0 +1,442 @@
+"""
+DTO 검증 / 변환 plan
+- type annotation 하나를 Validator 하나로 한 번만 compile 하고 (DTO class는 처음 사용할 때) 재사용
+- check(value): 값을 바꾸지 않고 검사, 맞으면 None / 틀리면 첫 번째로 틀린 위치의 Mismatch
+- convert(value): check를 통과한 값을 DTO instance로 변환 (dict -> DTO, list -> list)
+- check_instance(value): 생성된 DTO의 field 값 검사, DTO 자리에는 dict를 받지 않고 instance만 허용
+- Union은 값의 type 별로 가능한 arm만 선언 순서대로 미리 골라 두고 예외 없이 check로 고름
+"""
+import dataclasses
+from typing import Any, ForwardRef, Optional, Union, get_args, get_origin, _TypedDictMeta
+
+from typeguard import check_type, TypeCheckError
+
+from dtos import DICT_TYPE, LIST_TYPE, _DTODict
+
+DICT_TYPES = frozenset(DICT_TYPE)
+LIST_TYPES = frozenset(LIST_TYPE)
+NONE_TYPE = type(None)
+# typeguard와 같이 int는 float, complex 자리에 허용 (PEP 484 numeric tower)
+NUMERIC_TYPES = {float: (int, float), complex: (int, float, complex)}
+
+
+class Mismatch:
+    """
+    검사 실패 위치와 이유, path는 안쪽부터 쌓이고 path_str로 바깥쪽부터 표시
+    """
+    __slots__ = ('value', 'reason', '_path')
+
+    def __init__(self, value, reason: str):
+        self.value = value
+        self.reason = reason
+        self._path = []
+
+    def at(self, element) -> 'Mismatch':
+        self._path.append(element)
+        return self
+
+    @property
+    def path(self) -> tuple:
+        return tuple(reversed(self._path))
+
+    @property
+    def path_str(self) -> str:
+        rtn = ''
+        for element in self.path:
+            rtn += f'[{element}]' if type(element) is int else (f'.{element}' if rtn else element)
+        return rtn or 'value'
+
+    def __str__(self):
+        return f'{self.path_str} ({type(self.value).__name__}) {self.reason}'
+
+    def as_error(self) -> TypeCheckError:
+        return TypeCheckError(str(self))
+
+
+class Validator:
+    # convert가 값을 그대로 돌려주면 True (list / DTO 변환 시 생략)
+    is_identity = True
+
+    def accepts(self, tp: type) -> bool:
+        """
+        이 type의 값이 check를 통과할 가능성이 있는지 (Union dispatch용, 값은 보지 않음)
+        """
+        return True
+
+    def check(self, value) -> Optional[Mismatch]:
+        return None
+
+    def check_instance(self, value) -> Optional[Mismatch]:
+        return self.check(value)
+
+    def convert(self, value):
+        return value
+
+
+class AnyValidator(Validator):
+    pass
+
+
+class InstanceValidator(Validator):
+    def __init__(self, tp: type):
+        self.types = NUMERIC_TYPES.get(tp, tp)
+        self.name = tp.__name__
+
+    def accepts(self, tp: type) -> bool:
+        return issubclass(tp, self.types)
+
+    def check(self, value) -> Optional[Mismatch]:
+        if isinstance(value, self.types):
+            return None
+        return Mismatch(value, f'is not an instance of {self.name}')
+
+
+class NoneValidator(Validator):
+    def accepts(self, tp: type) -> bool:
+        return tp is NONE_TYPE
+
+    def check(self, value) -> Optional[Mismatch]:
+        if value is None:
+            return None
+        return Mismatch(value, 'is not None')
+
+
+class ListValidator(Validator):
+    """
+    List[X], Tuple[X], Tuple[X, ...] (DTOFormatter와 같이 tuple도 같은 type의 나열로 취급)
+    """
+
+    def __init__(self, item: Validator):
+        self.item = item
+        self.is_identity = item.is_identity
+
+    def accepts(self, tp: type) -> bool:
+        return tp in LIST_TYPES
+
+    def check(self, value) -> Optional[Mismatch]:
+        return self._check(value, self.item.check)
+
+    def check_instance(self, value) -> Optional[Mismatch]:
+        return self._check(value, self.item.check_instance)
+
+    @staticmethod
+    def _check(value, check) -> Optional[Mismatch]:
+        if type(value) not in LIST_TYPES:
+            return Mismatch(value, 'is not a list')
+        for i, item in enumerate(value):
+            mismatch = check(item)
+            if mismatch is not None:
+                return mismatch.at(i)
+        return None
+
+    def convert(self, value):
+        if self.is_identity:
+            return value if type(value) is list else list(value)
+        convert = self.item.convert
+        return [convert(item) for item in value]
+
+
+class DictValidator(Validator):
+    """
+    dict, Dict[K, V]
+    """
+
+    def __init__(self, key: Validator, value: Validator):
+        self.key = key
+        self.value = value
+        self.is_identity = value.is_identity
+        self.is_any = isinstance(key, AnyValidator) and isinstance(value, AnyValidator)
+
+    def accepts(self, tp: type) -> bool:
+        return issubclass(tp, dict)
+
+    def check(self, value) -> Optional[Mismatch]:
+        return self._check(value, self.value.check)
+
+    def check_instance(self, value) -> Optional[Mismatch]:
+        return self._check(value, self.value.check_instance)
+
+    def _check(self, value, check) -> Optional[Mismatch]:
+        if not isinstance(value, dict):
+            return Mismatch(value, 'is not a dict')
+        if self.is_any:
+            return None
+        for key, item in value.items():
+            mismatch = self.key.check(key) or check(item)
+            if mismatch is not None:
+                return mismatch.at(key)
+        return None
+
+    def convert(self, value):
+        if self.is_identity:
+            return value
+        convert = self.value.convert
+        return {key: convert(item) for key, item in value.items()}
+
+
+class TypedDictValidator(Validator):
+    def __init__(self, tp):
+        self.fields = {key: type_validator(val) for key, val in tp.__annotations__.items()}
+        required_keys = getattr(tp, '__required_keys__', self.fields)
+        self.required = tuple(key for key in self.fields if key in required_keys)
+        self.is_identity = all(field.is_identity for field in self.fields.values())
+
+    def accepts(self, tp: type) -> bool:
+        return tp in DICT_TYPES
+
+    def check(self, value) -> Optional[Mismatch]:
+        if type(value) not in DICT_TYPES:
+            return Mismatch(value, 'is not a dict')
+        return check_fields(value, self.fields, self.required)
+
+    def check_instance(self, value) -> Optional[Mismatch]:
+        if type(value) not in DICT_TYPES:
+            return Mismatch(value, 'is not a dict')
+        return check_fields(value, self.fields, self.required, instance=True)
+
+    def convert(self, value):
+        if self.is_identity:
+            return value
+        return {key: self.fields[key].convert(item) for key, item in value.items()}
+
+
+class UnionValidator(Validator):
+    def __init__(self, arms: tuple):
+        self.arms = arms
+        self.is_identity = all(arm.is_identity for arm in arms)
+        # 값의 type -> 해당 type을 받을 수 있는 arm들 (선언 순서 유지)
+        self._dispatch = {}
+
+    def candidates(self, tp: type) -> tuple:
+        arms = self._dispatch.get(tp)
+        if arms is None:
+            arms = self._dispatch[tp] = tuple(arm for arm in self.arms if arm.accepts(tp))
+        return arms
+
+    def accepts(self, tp: type) -> bool:
+        return bool(self.candidates(tp))
+
+    def check(self, value) -> Optional[Mismatch]:
+        mismatch = None
+        for arm in self.candidates(type(value)):
+            mismatch = arm.check(value)
+            if mismatch is None:
+                return None
+        return mismatch or Mismatch(value, 'did not match any element in the union')
+
+    def check_instance(self, value) -> Optional[Mismatch]:
+        mismatch = None
+        for arm in self.candidates(type(value)):
+            mismatch = arm.check_instance(value)
+            if mismatch is None:
+                return None
+        return mismatch or Mismatch(value, 'did not match any element in the union')
+
+    def convert(self, value):
+        if self.is_identity:
+            return value
+        arms = self.candidates(type(value))
+        if len(arms) == 1:
+            return arms[0].convert(value)
+        for arm in arms:
+            if arm.check(value) is None:
+                return arm.convert(value)
+        return value
+
+
+class DTOValidator(Validator):
+    is_identity = False
+
+    def __init__(self, dto_class):
+        self.dto_class = dto_class
+
+    def accepts(self, tp: type) -> bool:
+        return tp in DICT_TYPES or issubclass(tp, self.dto_class)
+
+    def check(self, value) -> Optional[Mismatch]:
+        if type(value) in DICT_TYPES:
+            return dto_plan(self.dto_class).check(value)
+        if isinstance(value, self.dto_class):
+            return None
+        return Mismatch(value, f'is not a dict or an instance of {self.dto_class.__name__}')
+
+    def check_instance(self, value) -> Optional[Mismatch]:
+        if isinstance(value, self.dto_class):
+            return None
+        return Mismatch(value, f'is not an instance of {self.dto_class.__name__}')
+
+    def convert(self, value):
+        if type(value) in DICT_TYPES:
+            return dto_plan(self.dto_class).build(value)
+        return value
+
+
+class ForwardRefValidator(Validator):
+    """
+    아직 정의되지 않은 DTO 이름, 처음 사용할 때 _DTODict에서 찾음
+    """
+    is_identity = False
+
+    def __init__(self, ref: ForwardRef):
+        self.ref = ref
+        self._validator = None
+
+    @property
+    def validator(self) -> Validator:
+        if self._validator is None:
+            self._validator = type_validator(_DTODict[self.ref.__forward_arg__])
+        return self._validator
+
+    def accepts(self, tp: type) -> bool:
+        return self.validator.accepts(tp)
+
+    def check(self, value) -> Optional[Mismatch]:
+        return self.validator.check(value)
+
+    def check_instance(self, value) -> Optional[Mismatch]:
+        return self.validator.check_instance(value)
+
+    def convert(self, value):
+        return self.validator.convert(value)
+
+
+class TypeguardValidator(Validator):
+    """
+    위에서 처리하지 않는 annotation (Literal, Callable 등)은 typeguard로 검사
+    """
+
+    def __init__(self, tp):
+        self.tp = tp
+
+    def check(self, value) -> Optional[Mismatch]:
+        try:
+            check_type(value, self.tp)
+        except TypeCheckError as e:
+            return Mismatch(value, str(e))
+        return None
+
+
+def check_fields(value: dict, fields: dict, required: tuple, instance: bool = False) -> Optional[Mismatch]:
+    for key, item in value.items():
+        field_validator = fields.get(key)
+        if field_validator is None:
+            return Mismatch(item, 'is not a field').at(key)
+        mismatch = field_validator.check_instance(item) if instance else field_validator.check(item)
+        if mismatch is not None:
+            return mismatch.at(key)
+    # value의 key는 모두 field이므로 개수가 모자랄 때만 필수 field 확인
+    if len(value) < len(fields):
+        for key in required:
+            if key not in value:
+                return Mismatch(None, 'is missing').at(key)
+    return None
+
+
+_validators = {}
+
+
+def type_validator(tp) -> Validator:
+    """
+    annotation -> Validator (type 별로 한 번만 만듦)
+    """
+    try:
+        return _validators[tp]
+    except KeyError:
+        validator = _validators[tp] = compile_type(tp)
+        return validator
+    except TypeError:
+        # hash 할 수 없는 annotation
+        return compile_type(tp)
+
+
+def compile_type(tp) -> Validator:
+    if tp is Any:
+        return AnyValidator()
+    if tp is None or tp is NONE_TYPE:
+        return NoneValidator()
+    if type(tp) is ForwardRef:
+        if tp.__forward_evaluated__ and tp.__forward_value__ is not None:
+            return type_validator(tp.__forward_value__)
+        return ForwardRefValidator(tp)
+    if hasattr(tp, 'dto_fields'):
+        return DTOValidator(tp)
+    if type(tp) is _TypedDictMeta:
+        return TypedDictValidator(tp)
+
+    origin, args = get_origin(tp), get_args(tp)
+    if origin is Union:
+        return UnionValidator(tuple(type_validator(arg) for arg in args))
+    if origin in (list, tuple):
+        return ListValidator(type_validator(args[0]) if args else AnyValidator())
+    if origin is dict or tp is dict:
+        key, value = args if args else (Any, Any)
+        return DictValidator(type_validator(key), type_validator(value))
+    if tp is list or tp is tuple:
+        return ListValidator(AnyValidator())
+    if isinstance(tp, type) and origin is None:
+        return InstanceValidator(tp)
+    return TypeguardValidator(tp)
+
+
+class DTOPlan:
+    """
+    DTO class 하나의 field 별 Validator와 생성 정보
+    - fields: dto_fields의 type annotation (다른 init field는 type 검사 없이 허용)
+    - build: 검사를 마친 dict로 __init__ / __post_init__을 거치지 않고 instance 생성
+    """
+
+    def __init__(self, dto_class):
+        self.dto_class = dto_class
+        self.checked = tuple((name, type_validator(tp)) for name, tp in dto_class.dto_fields.items())
+        self.fields = {}
+        self.defaults = {}
+        self.default_factories = {}
+        required = []
+        validators = dict(self.checked)
+        for f in dataclasses.fields(dto_class):
+            has_default = f.default is not dataclasses.MISSING or f.default_factory is not dataclasses.MISSING
+            if f.default is not dataclasses.MISSING:
+                self.defaults[f.name] = f.default
+            elif f.default_factory is not dataclasses.MISSING:
+                self.default_factories[f.name] = f.default_factory
+            if not f.init:
+                continue
+            self.fields[f.name] = validators.get(f.name) or AnyValidator()
+            if not has_default:
+                required.append(f.name)
+        self.required = tuple(required)
+        self.converters = {name: v.convert for name, v in self.fields.items() if not v.is_identity}
+
+    def check(self, value: dict) -> Optional[Mismatch]:
+        return check_fields(value, self.fields, self.required)
+
+    def check_instance(self, dto) -> Optional[Mismatch]:
+        for name, validator in self.checked:
+            mismatch = validator.check_instance(getattr(dto, name))
+            if mismatch is not None:
+                return mismatch.at(name)
+        return None
+
+    def build(self, value: dict):
+        dto = object.__new__(self.dto_class)
+        attrs = dto.__dict__
+        attrs.update(self.defaults)
+        for name, factory in self.default_factories.items():
+            attrs[name] = factory()
+        converters = self.converters
+        for name, item in value.items():
+            convert = converters.get(name)
+            attrs[name] = item if convert is None else convert(item)
+        return dto
+
+
+def dto_plan(dto_class) -> DTOPlan:
+    """
+    DTO class 별로 처음 사용할 때 한 번 만듦
+    (string annotation은 dtos/__init__에서 모든 DTO 정의 후 풀리므로 class 생성 시점에는 만들지 않음)
+    """
+    plan = dto_class.__dict__.get('_dto_plan')
+    if plan is None:
+        plan = DTOPlan(dto_class)
+        setattr(dto_class, '_dto_plan', plan)
+    return plan
@@ -0,0 +1,9 @@
+from django.contrib import admin
+
+from jobs.models import Job
+
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'task', 'status', 'attempts', 'run_at', 'last_error']
+    list_filter = ['status', 'task']
+
+admin.site.register(Job, JobAdmin)
@@ -0,0 +1,42 @@
+import os
+import signal
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from jobs.queue import JOB_BATCH_SIZE, claim_jobs, run_jobs
+
+# 실행할 job이 없을 때 다시 확인하기까지 기다리는 시간 (초)
+JOB_POLL_INTERVAL = 1.0
+
+
+class Command(BaseCommand):
+    help = 'jobs.Job에 쌓인 background 작업을 실행하는 worker'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=JOB_BATCH_SIZE)
+        parser.add_argument('--poll-interval', type=float, default=JOB_POLL_INTERVAL)
+        parser.add_argument('--once', action='store_true', help='지금 실행할 수 있는 job만 처리하고 종료')
+
+    def handle(self, *args, **options):
+        worker = f'{socket.gethostname()}:{os.getpid()}'
+        self.stopping = False
+        # 배포 / 재시작 시 실행 중인 batch는 끝내고 종료
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        while not self.stopping:
+            close_old_connections()
+            jobs = claim_jobs(worker, options['batch_size'])
+            if jobs:
+                done, failed = run_jobs(jobs)
+                self.stdout.write(f'{worker}: {done} done, {failed} failed')
+                continue
+            if options['once']:
+                break
+            time.sleep(options['poll_interval'])
+
+    def stop(self, signum, frame):
+        self.stopping = True
@@ -0,0 +1,119 @@
+import datetime
+import logging
+import traceback
+from typing import Callable, Optional
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from jobs.models import Job
+
+logger = logging.getLogger(__name__)
+
+# worker가 한 번에 가져가는 job 수
+JOB_BATCH_SIZE = 20
+JOB_MAX_ATTEMPTS = 5
+# 실패하면 JOB_RETRY_BACKOFF * 2^(attempts-1)초 뒤에 다시 실행 (최대 JOB_RETRY_BACKOFF_MAX)
+JOB_RETRY_BACKOFF = 10
+JOB_RETRY_BACKOFF_MAX = 3600
+# RUNNING인 채로 이 시간이 지난 job은 worker가 죽은 것으로 보고 다시 가져감
+JOB_LOCK_TIMEOUT = datetime.timedelta(minutes=10)
+
+
+def task_name(func: Callable) -> str:
+    return f'{func.__module__}.{func.__qualname__}'
+
+
+def enqueue(func: Callable, run_at: Optional[datetime.datetime] = None,
+            max_attempts: int = JOB_MAX_ATTEMPTS, **payload) -> Job:
+    """
+    func(**payload)를 worker에서 실행하도록 등록 (payload는 json으로 저장할 수 있는 값만)
+    호출한 쪽 transaction이 rollback되면 job도 같이 취소됨
+    """
+    return Job.objects.create(
+        task=task_name(func),
+        payload=payload,
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts,
+    )
+
+
+async def aenqueue(func: Callable, run_at: Optional[datetime.datetime] = None,
+                   max_attempts: int = JOB_MAX_ATTEMPTS, **payload) -> Job:
+    """
+    enqueue의 async ORM 버전
+    """
+    return await Job.objects.acreate(
+        task=task_name(func),
+        payload=payload,
+        run_at=run_at or timezone.now(),
+        max_attempts=max_attempts,
+    )
+
+
+def claimable(now: datetime.datetime):
+    return Job.objects.filter(
+        Q(status=Job.Status.PENDING, run_at__lte=now)
+        | Q(status=Job.Status.RUNNING, locked_at__lt=now - JOB_LOCK_TIMEOUT)
+    )
+
+
+def claim_jobs(worker: str, batch_size: int = JOB_BATCH_SIZE) -> list:
+    """
+    실행할 job을 최대 batch_size개 RUNNING으로 바꾸고 return
+    - SELECT ... FOR UPDATE SKIP LOCKED로 다른 worker가 잡고 있는 row는 기다리지 않고 건너뜀
+    - skip locked를 지원하지 않는 DB(sqlite)에서도 UPDATE에 같은 조건을 걸어 한 worker만 가져가도록 함
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            claimable(now)
+            .select_for_update(skip_locked=True)
+            .order_by('run_at')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return []
+        claimable(now).filter(id__in=ids).update(
+            status=Job.Status.RUNNING,
+            locked_at=now,
+            locked_by=worker,
+            attempts=F('attempts') + 1,
+        )
+    return list(Job.objects.filter(id__in=ids, locked_by=worker, locked_at=now).order_by('run_at'))
+
+
+def retry_delay(attempts: int) -> datetime.timedelta:
+    return datetime.timedelta(seconds=min(JOB_RETRY_BACKOFF * 2 ** (attempts - 1), JOB_RETRY_BACKOFF_MAX))
+
+
+def run_jobs(jobs: list) -> tuple:
+    """
+    claim_jobs로 가져온 job 실행, (성공 수, 실패 수)
+    성공한 job은 한 번에 지우고, 실패한 job은 backoff 후 재시도하거나 max_attempts가 넘으면 FAILED
+    """
+    done = []
+    failed = 0
+    for job in jobs:
+        try:
+            import_string(job.task)(**job.payload)
+        except Exception:
+            failed += 1
+            logger.exception('job failed: %s', job)
+            job.last_error = traceback.format_exc()[-2000:]
+            job.locked_at = None
+            job.locked_by = ''
+            if job.attempts >= job.max_attempts:
+                job.status = Job.Status.FAILED
+            else:
+                job.status = Job.Status.PENDING
+                job.run_at = timezone.now() + retry_delay(job.attempts)
+            job.save(update_fields=['status', 'run_at', 'locked_at', 'locked_by', 'last_error', 'updated_at'])
+        else:
+            done.append(job.id)
+
+    if done:
+        Job.objects.filter(id__in=done).delete()
+    return len(done), failed
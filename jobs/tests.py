@@ -0,0 +1,80 @@
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.queue import JOB_LOCK_TIMEOUT, claim_jobs, enqueue, retry_delay, run_jobs
+
+CALLS = []
+
+
+def ok_task(value):
+    CALLS.append(value)
+
+
+def failing_task():
+    raise RuntimeError('boom')
+
+
+class JobQueueTest(TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_claim_is_exclusive(self):
+        jobs = [enqueue(ok_task, value=i) for i in range(5)]
+        enqueue(ok_task, run_at=timezone.now() + datetime.timedelta(hours=1), value=99)
+
+        first = claim_jobs('worker-a', 3)
+        second = claim_jobs('worker-b', 10)
+
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(second), 2)
+        self.assertFalse({job.id for job in first} & {job.id for job in second})
+        self.assertEqual({job.id for job in first + second}, {job.id for job in jobs})
+        self.assertEqual(claim_jobs('worker-c'), [])
+        for job in first + second:
+            self.assertEqual((job.status, job.attempts), (Job.Status.RUNNING, 1))
+
+    def test_reclaim_stale_running_job(self):
+        job = enqueue(ok_task, value=1)
+        self.assertEqual([claimed.id for claimed in claim_jobs('worker-a')], [job.id])
+        # lock timeout 전에는 다른 worker가 가져가지 않음
+        self.assertEqual(claim_jobs('worker-b'), [])
+
+        stale = timezone.now() - JOB_LOCK_TIMEOUT - datetime.timedelta(seconds=1)
+        Job.objects.filter(id=job.id).update(locked_at=stale)
+        reclaimed = claim_jobs('worker-b')
+        self.assertEqual([claimed.id for claimed in reclaimed], [job.id])
+        self.assertEqual((reclaimed[0].locked_by, reclaimed[0].attempts), ('worker-b', 2))
+
+    def test_retry_then_fail(self):
+        job = enqueue(failing_task, max_attempts=2)
+        now = timezone.now()
+
+        with mock.patch('jobs.queue.timezone.now', return_value=now), self.assertLogs('jobs.queue', 'ERROR'):
+            self.assertEqual(run_jobs(claim_jobs('worker-a')), (0, 1))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.Status.PENDING, 1))
+        self.assertEqual(job.run_at, now + retry_delay(1))
+        self.assertEqual((job.locked_at, job.locked_by), (None, ''))
+        self.assertIn('boom', job.last_error)
+        # backoff가 지나기 전에는 다시 실행하지 않음
+        self.assertEqual(claim_jobs('worker-a'), [])
+
+        with mock.patch('jobs.queue.timezone.now', return_value=job.run_at), self.assertLogs('jobs.queue', 'ERROR'):
+            self.assertEqual(run_jobs(claim_jobs('worker-a')), (0, 1))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.Status.FAILED, 2))
+        self.assertEqual(claim_jobs('worker-a'), [])
+
+    def test_successful_jobs_are_deleted(self):
+        for i in range(3):
+            enqueue(ok_task, value=i)
+        failing = enqueue(failing_task)
+
+        with self.assertLogs('jobs.queue', 'ERROR'):
+            self.assertEqual(run_jobs(claim_jobs('worker-a')), (3, 1))
+        self.assertEqual(sorted(CALLS), [0, 1, 2])
+        self.assertEqual(list(Job.objects.values_list('id', flat=True)), [failing.id])
@@ -0,0 +1,137 @@
+import datetime
+import logging
+import threading
+import time
+from typing import Optional
+
+from django.core.cache import cache
+
+from records.timeline import build_timeline, timeline_etag, etag_matches
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_CACHE_TIMEOUT = 60 * 60
+# 기록 생성 시 올리는 user별 version, cache된 timeline은 저장할 때의 version과 같을 때만 사용
+TIMELINE_VERSION_KEY = 'records:timeline:version:{user_id}'
+
+TIMELINE_CACHE_STATS_KEY = 'records:timeline:stats:{name}'
+# process 안에서 모은 hit/miss를 이 주기(초)마다 공유 cache에 더하고 log로 남김
+TIMELINE_CACHE_STATS_FLUSH_INTERVAL = 60
+
+_timeline_cache_stats_lock = threading.Lock()
+_timeline_cache_stats = dict(hits=0, misses=0)
+_timeline_cache_stats_flushed_at = time.monotonic()
+
+
+def timeline_cache_key(user_id: int, date_end: datetime.date) -> str:
+    # user : profile = 1 : 1 이므로 profile 조회 없이 user id로 key를 만든다.
+    return f'records:timeline:{user_id}:{date_end.isoformat()}'
+
+
+def timeline_version_key(user_id: int) -> str:
+    return TIMELINE_VERSION_KEY.format(user_id=user_id)
+
+
+def get_cached_timeline(user_id: int, date_end: datetime.date) -> (int, Optional[dict]):
+    """
+    (user의 timeline version, cache된 dict(version=..., etag=..., results=...))
+    version이 다르면(그 사이 기록이 바뀐 경우) cache miss로 보고 None
+    """
+    version_key, key = timeline_version_key(user_id), timeline_cache_key(user_id, date_end)
+    cached = cache.get_many([version_key, key])
+    version = cached.get(version_key, 0)
+    timeline = cached.get(key)
+    if timeline is not None and timeline['version'] != version:
+        timeline = None
+    count_timeline_cache('misses' if timeline is None else 'hits')
+    return version, timeline
+
+
+def set_cached_timeline(user_id: int, date_end: datetime.date, version: int, etag: str, results: list):
+    cache.set(
+        timeline_cache_key(user_id, date_end),
+        dict(version=version, etag=etag, results=results),
+        TIMELINE_CACHE_TIMEOUT,
+    )
+
+
+def get_timeline(user_id: int, queryset, date_st: datetime.date, date_end: datetime.date,
+                 if_none_match: Optional[str] = None) -> (str, Optional[list]):
+    """
+    (user, date_end) 기준 7일 timeline의 (etag, results)를 return
+    cache miss인 경우 aggregate로 etag를 먼저 구하고, if_none_match와 같으면 serialize 없이 (etag, None)
+    """
+    version, timeline = get_cached_timeline(user_id, date_end)
+    if timeline is not None:
+        return timeline['etag'], timeline['results']
+
+    etag = timeline_etag(queryset, date_st, date_end)
+    if if_none_match is not None and etag_matches(etag, if_none_match):
+        return etag, None
+
+    results = build_timeline(queryset, date_st, date_end)
+    # 조회 전에 읽은 version으로 저장하므로, 그 사이 invalidate 되었으면 다음 조회에서 miss
+    set_cached_timeline(user_id, date_end, version, etag, results)
+    return etag, results
+
+
+def invalidate_timeline(user_id: int):
+    """
+    user의 timeline version을 올려서 cache된 모든 7일 구간을 무효화
+    """
+    key = timeline_version_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # 처음 올리는 경우, 다른 process가 먼저 만들었으면 incr
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def count_timeline_cache(name: str):
+    global _timeline_cache_stats_flushed_at
+    with _timeline_cache_stats_lock:
+        _timeline_cache_stats[name] += 1
+        if time.monotonic() - _timeline_cache_stats_flushed_at < TIMELINE_CACHE_STATS_FLUSH_INTERVAL:
+            return
+    flush_timeline_cache_stats()
+
+
+def _incr_shared(name: str, delta: int):
+    key = TIMELINE_CACHE_STATS_KEY.format(name=name)
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # 처음 더하는 경우, 다른 process가 먼저 만들었으면 incr
+        if not cache.add(key, delta, None):
+            cache.incr(key, delta)
+
+
+def flush_timeline_cache_stats():
+    """
+    process 단위 hit/miss를 공유 cache에 더하고 전체 집계를 log로 남김
+    """
+    global _timeline_cache_stats_flushed_at
+    with _timeline_cache_stats_lock:
+        pending = dict(_timeline_cache_stats)
+        _timeline_cache_stats.update(hits=0, misses=0)
+        _timeline_cache_stats_flushed_at = time.monotonic()
+
+    for name, delta in pending.items():
+        if delta:
+            _incr_shared(name, delta)
+    stats = timeline_cache_stats(flush=False)
+    logger.info('timeline cache: hits=%d misses=%d hit_ratio=%.3f', stats['hits'], stats['misses'], stats['hit_ratio'])
+
+
+def timeline_cache_stats(flush: bool = True) -> dict:
+    """
+    모든 process의 hit/miss 집계 (공유 cache 기준)
+    """
+    if flush:
+        flush_timeline_cache_stats()
+    shared = cache.get_many([TIMELINE_CACHE_STATS_KEY.format(name=name) for name in ('hits', 'misses')])
+    hits = shared.get(TIMELINE_CACHE_STATS_KEY.format(name='hits'), 0)
+    misses = shared.get(TIMELINE_CACHE_STATS_KEY.format(name='misses'), 0)
+    total = hits + misses
+    return dict(hits=hits, misses=misses, hit_ratio=hits / total if total else 0.0)
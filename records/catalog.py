@@ -0,0 +1,65 @@
+import datetime
+from typing import Optional
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+
+from records.models import Content
+
+CONTENT_CATALOG_CACHE_KEY = 'records:content_catalog:{version}:{count}'
+CONTENT_CATALOG_TIMEOUT = 60 * 60 * 24
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def datetime_to_version(value: Optional[datetime.datetime]) -> int:
+    # float timestamp는 microsecond 정밀도가 깨질 수 있어 정수 연산으로 변환
+    if value is None:
+        return 0
+    return (value - _EPOCH) // datetime.timedelta(microseconds=1)
+
+
+def version_to_datetime(version: int) -> datetime.datetime:
+    return _EPOCH + datetime.timedelta(microseconds=version)
+
+
+def get_catalog_version() -> (int, int):
+    """
+    (version, 전체 row 수)
+    version은 Content의 최대 updated_at (microsecond 단위 정수), 삭제는 row 수로 감지
+    """
+    aggregated = Content.objects.aggregate(updated_at=Max('updated_at'), count=Count('id'))
+    return datetime_to_version(aggregated['updated_at']), aggregated['count']
+
+
+def catalog_etag(version: int, count: int, since_version: Optional[int] = None) -> str:
+    return f'"{version}-{count}-{since_version or 0}"'
+
+
+def _serialize_contents(queryset) -> list:
+    return [dict(id=content_id, text=text) for content_id, text in queryset.values_list('id', 'text')]
+
+
+def get_catalog(version: int, count: int, since_version: Optional[int] = None) -> dict:
+    """
+    since_version이 없으면 active content 전체, 있으면 그 이후 변경된 active content와 비활성화된 id만 return
+    (경계의 같은 updated_at row는 다시 내려줄 수 있으므로 client는 id 기준으로 덮어쓰면 됩니다.)
+    """
+    if since_version is not None:
+        changed = Content.objects.filter(updated_at__gte=version_to_datetime(since_version)).order_by('id')
+        return dict(
+            version=version,
+            contents=_serialize_contents(changed.filter(is_active=True)),
+            removed=list(changed.filter(is_active=False).values_list('id', flat=True)),
+        )
+
+    key = CONTENT_CATALOG_CACHE_KEY.format(version=version, count=count)
+    catalog = cache.get(key)
+    if catalog is None:
+        catalog = dict(
+            version=version,
+            contents=_serialize_contents(Content.objects.filter(is_active=True).order_by('id')),
+            removed=[],
+        )
+        cache.set(key, catalog, CONTENT_CATALOG_TIMEOUT)
+    return catalog
@@ -0,0 +1,51 @@
+import csv
+
+from records.pagination import filter_after_position
+from records.projection import project_records, records_to_representation
+from WAKe_server.renderers import FastJSONRenderer
+
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_CSV_HEADER = ('id', 'text', 'created_at', 'updated_at', 'content_id', 'content_text')
+
+
+def iter_record_chunks(queryset, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """
+    (created_at, id) keyset으로 chunk_size개씩 잘라서 조회
+    mysqlclient는 iterator()를 써도 결과 전체를 client에 buffering 하므로,
+    chunk 단위 query로 나눠야 record 수와 상관없이 memory가 일정합니다.
+    """
+    queryset = project_records(queryset).order_by('created_at', 'id')
+    position = None
+    while True:
+        chunk_queryset = queryset if position is None else filter_after_position(queryset, *position)
+        rows = list(chunk_queryset[:chunk_size])
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+        position = (rows[-1].created_at, rows[-1].id)
+
+
+def stream_ndjson(queryset, chunk_size: int = EXPORT_CHUNK_SIZE):
+    renderer = FastJSONRenderer()
+    for rows in iter_record_chunks(queryset, chunk_size):
+        yield b''.join(renderer.render(record) + b'\n' for record in records_to_representation(rows))
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def stream_csv(queryset, chunk_size: int = EXPORT_CHUNK_SIZE):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_CSV_HEADER)
+    for rows in iter_record_chunks(queryset, chunk_size):
+        yield ''.join(
+            writer.writerow((
+                record['id'], record['text'], record['created_at'], record['updated_at'],
+                record['content']['id'], record['content']['text'],
+            ))
+            for record in records_to_representation(rows)
+        )
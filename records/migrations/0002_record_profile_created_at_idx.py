@@ -0,0 +1,19 @@
+# Generated by Django 5.0.4 on 2026-10-18 14:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0002_user_is_ghost"),
+        ("records", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                fields=["profile", "created_at"], name="record_profile_created_at_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 5.0.4 on 2026-10-18 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("records", "0002_record_profile_created_at_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="content",
+            index=models.Index(fields=["updated_at"], name="content_updated_at_idx"),
+        ),
+    ]
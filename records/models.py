@@ -1,5 +1,4 @@
-from django.db import models
-
+from django.db import models, transaction
 
 
 class Content(models.Model):
@@ -9,6 +8,35 @@ class Content(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at'], name='content_updated_at_idx'),
+        ]
+
+
+class RecordManager(models.Manager):
+    def bulk_create_returning(self, records: list) -> list:
+        """
+        하나의 profile에 대한 records를 bulk_create 하고 pk가 채워진 records를 return
+        mysql은 bulk insert의 pk를 돌려주지 않으므로 (created_at, content_id)로 다시 조회해 채운다.
+        """
+        with transaction.atomic(using=self.db):
+            records = self.bulk_create(records)
+            if not records or records[0].pk is not None:
+                return records
+
+            created = self.filter(
+                profile_id=records[0].profile_id,
+                created_at__gte=records[0].created_at,
+                created_at__lte=records[-1].created_at,
+            ).order_by('id').values_list('created_at', 'content_id', 'id')
+            pks = {}
+            for created_at, content_id, pk in created:
+                pks.setdefault((created_at, content_id), []).append(pk)
+            for record in records:
+                record.pk = pks[(record.created_at, record.content_id)].pop(0)
+        return records
+
 
 class Record(models.Model):
     profile = models.ForeignKey('accounts.CommonProfile', on_delete=models.CASCADE)
@@ -18,3 +46,10 @@ class Record(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    objects = RecordManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['profile', 'created_at'], name='record_profile_created_at_idx'),
+        ]
@@ -0,0 +1,111 @@
+import base64
+import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def filter_after_position(queryset, created_at: datetime.datetime, pk: int):
+    """
+    (created_at, id) > (created_at, pk) 인 row만 남김
+    created_at__gte를 함께 걸어서 (profile, created_at) index range scan이 되도록 합니다.
+    """
+    return queryset.filter(
+        Q(created_at__gt=created_at) | Q(id__gt=pk),
+        created_at__gte=created_at,
+    )
+
+
+class RecordCursorPagination(BasePagination):
+    """
+    (created_at, id) 기준 keyset pagination
+    OFFSET 없이 마지막으로 받은 record 다음부터 page_size + 1개만 조회합니다.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 200
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = filter_after_position(queryset, *position)
+
+        records = list(queryset.order_by('created_at', 'id')[:self.page_size + 1])
+        self.has_next = len(records) > self.page_size
+        records = records[:self.page_size]
+
+        self.next_position = None
+        if self.has_next:
+            self.next_position = (records[-1].created_at, records[-1].id)
+        return records
+
+    def get_page_size(self, request) -> int:
+        page_size = request.query_params.get(self.page_size_query_param)
+        try:
+            page_size = int(page_size)
+        except (TypeError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            decoded = base64.urlsafe_b64decode(encoded.encode('ascii')).decode('ascii')
+            created_at, pk = decoded.split('|')
+            return datetime.datetime.fromisoformat(created_at), int(pk)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, position) -> str:
+        created_at, pk = position
+        raw = f'{created_at.isoformat()}|{pk}'
+        return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response(dict(
+            next=self.get_next_link(),
+            results=data
+        ))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'schema': {'type': 'integer'},
+            },
+        ]
@@ -0,0 +1,52 @@
+from typing import Optional
+
+from django.utils import timezone
+
+RECORD_PROJECTION_FIELDS = ('id', 'text', 'created_at', 'updated_at', 'content_id', 'content__text')
+
+
+def project_records(queryset, *extra_fields):
+    """
+    RecordSerializer에 필요한 column만 tuple로 조회 (model instance 생성 없음)
+    extra_fields는 RECORD_PROJECTION_FIELDS 뒤에 붙습니다. (ex. record_date)
+    """
+    return queryset.values_list(*RECORD_PROJECTION_FIELDS, *extra_fields, named=True)
+
+
+def format_datetime(value, tz) -> Optional[str]:
+    """
+    serializers.DateTimeField.to_representation (ISO_8601)과 같은 결과
+    """
+    if not value:
+        return None
+    value = value.astimezone(tz).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def records_to_representation(rows) -> list:
+    """
+    project_records의 row들을 RecordSerializer(many=True).data와 같은 형태의 dict로 변환
+    """
+    tz = timezone.get_current_timezone()
+    return [
+        {
+            'id': row[0],
+            'text': row[1],
+            'created_at': format_datetime(row[2], tz),
+            'updated_at': format_datetime(row[3], tz),
+            'content': {
+                'id': row[4],
+                'text': row[5],
+            },
+        }
+        for row in rows
+    ]
+
+
+def record_to_row(record, content_text: str) -> tuple:
+    """
+    저장한 Record instance를 project_records와 같은 순서의 tuple로 변환 (content 조회 없음)
+    """
+    return record.id, record.text, record.created_at, record.updated_at, record.content_id, content_text
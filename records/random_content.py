@@ -0,0 +1,198 @@
+import random
+import threading
+import time
+from array import array
+from typing import Optional
+
+from django.core.cache import cache
+
+from records.models import Content
+
+ACTIVE_CONTENT_IDS_VERSION_KEY = 'records:active_content_ids:version'
+# cache가 process 단위(locmem)인 경우 다른 process의 변경은 TTL이 지나야 반영됨
+ACTIVE_CONTENT_IDS_TTL = 60 * 5
+
+
+class ActiveContentIds:
+    """
+    process 단위로 들고 있는 active content id 배열 (+ id별 text)
+    Content 저장/삭제 시 cache의 version을 올려서 모든 process가 다음 조회 때 다시 불러옵니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = None  # (version, loaded_at, ids, id_set, texts)
+
+    @staticmethod
+    def _is_fresh(state: Optional[tuple], version: int) -> bool:
+        return state is not None and state[0] == version and time.monotonic() - state[1] < ACTIVE_CONTENT_IDS_TTL
+
+    def _get_state(self) -> tuple:
+        version = cache.get(ACTIVE_CONTENT_IDS_VERSION_KEY, 0)
+        state = self._state
+        if self._is_fresh(state, version):
+            return state
+
+        with self._lock:
+            # lock을 기다리는 동안 다른 thread가 이미 다시 불러온 경우 그대로 사용
+            state = self._state
+            if self._is_fresh(state, version):
+                return state
+            texts = dict(Content.objects.filter(is_active=True).order_by('id').values_list('id', 'text'))
+            ids = array('q', texts)
+            state = (version, time.monotonic(), ids, frozenset(ids), texts)
+            self._state = state
+        return state
+
+    def get(self) -> array:
+        return self._get_state()[2]
+
+    def get_set(self) -> frozenset:
+        return self._get_state()[3]
+
+    def get_text(self, content_id: int) -> Optional[str]:
+        return self._get_state()[4].get(content_id)
+
+    def snapshot(self) -> (int, array, frozenset):
+        """
+        같은 시점의 (version, id 배열, id set)
+        """
+        version, _, ids, id_set, _ = self._get_state()
+        return version, ids, id_set
+
+    def invalidate(self):
+        self._state = None
+        try:
+            cache.incr(ACTIVE_CONTENT_IDS_VERSION_KEY)
+        except ValueError:
+            cache.set(ACTIVE_CONTENT_IDS_VERSION_KEY, 1, None)
+
+
+active_content_ids = ActiveContentIds()
+
+
+def random_content_id(prev: Optional[int] = None) -> Optional[int]:
+    """
+    active content id 중 prev를 제외하고 하나를 균등하게 선택 (ORDER BY RAND() 없이 O(1))
+    """
+    ids = active_content_ids.get()
+    count = len(ids)
+    if count == 0:
+        return None
+
+    index = random.randrange(count)
+    if ids[index] == prev:
+        if count == 1:
+            return None
+        # prev를 뽑은 경우 나머지 count - 1개 중 하나로 이동
+        index = (index + random.randrange(1, count)) % count
+    return ids[index]
+
+
+def random_content(prev: Optional[int] = None) -> Optional[Content]:
+    content_id = random_content_id(prev)
+    if content_id is None:
+        return None
+
+    content = Content.objects.filter(id=content_id, is_active=True).only('id', 'text').first()
+    if content is None:
+        # 다른 process에서 비활성화/삭제된 경우 배열을 다시 불러와서 한 번 더 시도
+        active_content_ids.invalidate()
+        content_id = random_content_id(prev)
+        content = Content.objects.filter(id=content_id, is_active=True).only('id', 'text').first()
+    return content
+
+
+CONTENT_DECK_CACHE_KEY = 'records:content_deck:{user_id}'
+CONTENT_DECK_CURSOR_KEY = 'records:content_deck:{user_id}:cursor'
+CONTENT_DECK_TIMEOUT = 60 * 60 * 24 * 30
+
+
+def _shuffled(ids) -> array:
+    deck = array('q', ids)
+    random.shuffle(deck)
+    return deck
+
+
+def draw_content_ids(user_id: int, count: int = 1, exclude=()) -> list:
+    """
+    user별로 섞어둔 active content id deck에서 exclude를 제외한 서로 다른 id를 최대 count개 꺼냄
+    - deck을 다 쓰기 전까지는 같은 질문이 다시 나오지 않음
+    - deck은 cache에 dict(ids=bytes, version=int), cursor는 별도 key에 저장
+      한 번 뽑을 때는 cursor만 저장하고, deck은 다시 섞거나 active content version이 바뀐 경우에만 저장
+    - version이 바뀌면 deck에 없는 질문(새로 추가 / 다시 활성화)을 남은 deck에 섞어 넣음
+    - 비활성화된 질문은 꺼낼 때 건너뜀
+    """
+    version, active_ids, active_id_set = active_content_ids.snapshot()
+    if not active_ids:
+        return []
+
+    deck_key = CONTENT_DECK_CACHE_KEY.format(user_id=user_id)
+    cursor_key = CONTENT_DECK_CURSOR_KEY.format(user_id=user_id)
+    saved = cache.get_many([deck_key, cursor_key])
+    deck, cursor, deck_changed = array('q'), 0, True
+    saved_deck = saved.get(deck_key)
+    if saved_deck is None:
+        deck = _shuffled(active_ids)
+    else:
+        deck.frombytes(saved_deck['ids'])
+        cursor = min(saved.get(cursor_key, 0), len(deck))
+        deck_changed = saved_deck['version'] != version
+        if deck_changed:
+            known = set(deck)
+            added = [content_id for content_id in active_ids if content_id not in known]
+            if added:
+                deck = deck[:cursor] + _shuffled(deck[cursor:].tolist() + added)
+
+    exclude = set(exclude)
+    drawn = []
+    for _ in range(2):
+        while cursor < len(deck) and len(drawn) < count:
+            content_id = deck[cursor]
+            cursor += 1
+            if content_id in active_id_set and content_id not in exclude:
+                drawn.append(content_id)
+                exclude.add(content_id)
+        if len(drawn) == count:
+            break
+        # deck을 다 쓴 경우 전체를 다시 섞어서 시작
+        deck, cursor, deck_changed = _shuffled(active_ids), 0, True
+
+    if deck_changed:
+        cache.set_many({
+            deck_key: dict(ids=deck.tobytes(), version=version),
+            cursor_key: cursor,
+        }, CONTENT_DECK_TIMEOUT)
+    else:
+        cache.set(cursor_key, cursor, CONTENT_DECK_TIMEOUT)
+    return drawn
+
+
+def draw_content_id(user_id: int, prev: Optional[int] = None) -> Optional[int]:
+    drawn = draw_content_ids(user_id, exclude=() if prev is None else (prev,))
+    return drawn[0] if drawn else None
+
+
+def _active_contents(content_ids) -> dict:
+    return Content.objects.filter(id__in=content_ids, is_active=True).only('id', 'text').in_bulk()
+
+
+def draw_content(user_id: int, prev: Optional[int] = None) -> Optional[Content]:
+    drawn = draw_contents(user_id, 1, exclude=() if prev is None else (prev,))
+    return drawn[0] if drawn else None
+
+
+def draw_contents(user_id: int, count: int, exclude=()) -> list:
+    """
+    서로 다른 content를 최대 count개, 뽑힌 순서대로 id__in query 한 번으로 조회
+    """
+    content_ids = draw_content_ids(user_id, count, exclude)
+    contents = _active_contents(content_ids)
+    if len(contents) < len(content_ids):
+        # 다른 process에서 비활성화/삭제된 경우 배열을 다시 불러와서 모자란 만큼 한 번 더 뽑음
+        active_content_ids.invalidate()
+        content_ids = [content_id for content_id in content_ids if content_id in contents]
+        more = draw_content_ids(user_id, count - len(content_ids), (*exclude, *content_ids))
+        contents.update(_active_contents(more))
+        content_ids.extend(more)
+    return [contents[content_id] for content_id in content_ids if content_id in contents]
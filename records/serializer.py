@@ -12,6 +12,12 @@ class ContentSerializer(serializers.ModelSerializer):
         fields = ('id', 'text',)
 
 
+class ContentCatalogSerializer(serializers.Serializer):
+    version = serializers.IntegerField()
+    contents = ContentSerializer(many=True)
+    removed = serializers.ListField(child=serializers.IntegerField(), help_text='비활성화된 content id')
+
+
 class RecordSerializer(serializers.ModelSerializer):
     content = ContentSerializer()
 
@@ -25,6 +31,17 @@ class RecordListSerializer(serializers.Serializer):
     records = RecordSerializer(many=True)
 
 
+class RecordCalendarDaySerializer(serializers.Serializer):
+    date = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class RecordCalendarSerializer(serializers.Serializer):
+    date_from = serializers.CharField()
+    date_to = serializers.CharField()
+    days = RecordCalendarDaySerializer(many=True)
+
+
 class CreateRecordSerializer(serializers.Serializer):
     content_id = serializers.IntegerField()
     text = serializers.CharField(max_length=100, allow_blank=True, allow_null=True)
@@ -43,7 +60,69 @@ class RecordCreateSerializer(serializers.Serializer):  # todo: deprecated
 
 class RandomContentQuerySerializer(serializers.Serializer):
     prev = serializers.IntegerField(required=False, help_text='이전 content id')
+    count = serializers.IntegerField(required=False, min_value=1, max_value=20,
+                                     help_text='지정 시 서로 다른 content를 최대 count개 list로 return')
+    exclude = serializers.ListField(child=serializers.IntegerField(), required=False,
+                                    help_text='제외할 content id (exclude=1&exclude=2)')
+
+
+class ContentCatalogQuerySerializer(serializers.Serializer):
+    since_version = serializers.IntegerField(required=False, min_value=0,
+                                             help_text='이전 응답의 version, 지정 시 변경분만 return')
+
+
+# KST -> UTC 변환 시 datetime 범위를 넘지 않도록 양 끝 year는 제외
+QUERY_MIN_YEAR = datetime.MINYEAR + 1
+QUERY_MAX_YEAR = datetime.MAXYEAR - 1
+
+
+def check_query_year(year: int):
+    if not QUERY_MIN_YEAR <= year <= QUERY_MAX_YEAR:
+        raise serializers.ValidationError(f'year must be between {QUERY_MIN_YEAR} and {QUERY_MAX_YEAR}')
 
 
 class RecordListQuerySerializer(serializers.Serializer):
     target_date = serializers.CharField(help_text='YYYY-mm-dd', required=False)
+    to = serializers.DateField(help_text='YYYY-mm-dd, from과 함께 사용 (기본값: 오늘)', required=False)
+
+    def get_fields(self):
+        # from은 예약어라 class attribute로 선언할 수 없음
+        fields = super().get_fields()
+        fields['from'] = serializers.DateField(help_text='YYYY-mm-dd, 지정 시 기간 조회 + cursor pagination',
+                                               required=False)
+        return fields
+
+    def validate_from(self, value):
+        check_query_year(value.year)
+        return value
+
+    def validate_to(self, value):
+        check_query_year(value.year)
+        return value
+
+    def validate(self, attrs):
+        date_from, date_to = attrs.get('from'), attrs.get('to')
+        if date_from and date_to and date_from > date_to:
+            raise serializers.ValidationError('from must be before to')
+        return attrs
+
+
+class RecordCalendarQuerySerializer(serializers.Serializer):
+    month = serializers.RegexField(r'^\d{4}-\d{2}$', help_text='YYYY-mm', required=False)
+    year = serializers.RegexField(r'^\d{4}$', help_text='YYYY (month보다 우선)', required=False)
+
+    def validate_year(self, value):
+        check_query_year(int(value))
+        return value
+
+    def validate_month(self, value):
+        try:
+            month = datetime.datetime.strptime(value, '%Y-%m')
+        except ValueError:
+            raise serializers.ValidationError('invalid month')
+        check_query_year(month.year)
+        return value
+
+
+class RecordExportQuerySerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=('ndjson', 'csv'), help_text='ndjson(기본) / csv', required=False)
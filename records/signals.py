@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from records.models import Content
+from records.random_content import active_content_ids
+
+
+@receiver(post_save, sender=Content)
+@receiver(post_delete, sender=Content)
+def invalidate_active_content_ids(sender, **kwargs):
+    active_content_ids.invalidate()
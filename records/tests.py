@@ -0,0 +1,118 @@
+import datetime
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import SlidingToken
+
+from accounts.models import User, CommonProfile
+from accounts.tokens import CachedSlidingToken
+from records.cache import get_cached_timeline, set_cached_timeline, invalidate_timeline
+from records.models import Record, Content
+from records.random_content import CONTENT_DECK_CACHE_KEY, draw_content_ids
+
+
+class RecordTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('a@wake.com', 'pw')
+        self.profile = CommonProfile.objects.create(user=self.user, name='a')
+        self.content = Content.objects.create(text='q')
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {SlidingToken.for_user(self.user)}')
+
+
+class TimelineCacheTest(RecordTestCase):
+    def test_invalidate_during_rebuild(self):
+        date_end = datetime.date(2024, 1, 7)
+        version, timeline = get_cached_timeline(self.user.pk, date_end)
+        self.assertIsNone(timeline)
+
+        # 이전 version으로 조회한 결과를 invalidate 뒤에 늦게 저장해도 사용하지 않음
+        invalidate_timeline(self.user.pk)
+        set_cached_timeline(self.user.pk, date_end, version, 'etag', [])
+        self.assertIsNone(get_cached_timeline(self.user.pk, date_end)[1])
+
+        version, _ = get_cached_timeline(self.user.pk, date_end)
+        set_cached_timeline(self.user.pk, date_end, version, 'etag', [])
+        self.assertEqual(get_cached_timeline(self.user.pk, date_end)[1]['etag'], 'etag')
+
+    def test_create_invalidates_timeline(self):
+        first = self.client.get('/api/records/')
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(self.client.get('/api/records/')['ETag'], first['ETag'])
+
+        Record.objects.create(profile=self.profile, content=self.content, text='a')
+        self.assertEqual(self.client.get('/api/records/')['ETag'], first['ETag'])
+
+        response = self.client.post('/api/records/', dict(content_id=self.content.id, text='b'), format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        second = self.client.get('/api/records/')
+        self.assertNotEqual(second['ETag'], first['ETag'])
+        self.assertEqual(sum(len(day['records']) for day in second.json()), 2)
+
+
+class RecordRangeQueryTest(RecordTestCase):
+    def test_year_bounds(self):
+        for query in ('from=0001-01-01', 'from=2020-01-01&to=9999-12-31'):
+            response = self.client.get(f'/api/records/?{query}')
+            self.assertEqual(response.status_code, 400, query)
+
+        for query in ('from=0002-01-01', 'from=2020-01-01&to=9998-12-31'):
+            response = self.client.get(f'/api/records/?{query}')
+            self.assertEqual(response.status_code, 200, query)
+
+
+class ContentDeckTest(RecordTestCase):
+    def test_no_repeat_until_deck_used_up(self):
+        ids = {self.content.id} | {Content.objects.create(text=f'q{i}').id for i in range(4)}
+        deck_key = CONTENT_DECK_CACHE_KEY.format(user_id=self.user.pk)
+        drawn = draw_content_ids(self.user.pk)
+        deck = cache.get(deck_key)
+
+        # 한 번 뽑을 때는 cursor만 저장하고 deck은 그대로
+        drawn += draw_content_ids(self.user.pk, count=2)
+        drawn += draw_content_ids(self.user.pk, count=2)
+        self.assertEqual(cache.get(deck_key), deck)
+        self.assertEqual(sorted(drawn), sorted(ids))
+
+        # deck을 다 쓰면 다시 섞어서 시작
+        self.assertIn(draw_content_ids(self.user.pk)[0], ids)
+
+    def test_reactivated_content_joins_deck(self):
+        retired = Content.objects.create(text='retired', is_active=False)
+        others = [Content.objects.create(text=f'q{i}') for i in range(3)]
+        drawn = draw_content_ids(self.user.pk)
+
+        # 활성 개수와 최대 id가 그대로여도 version으로 변경을 감지
+        deactivated = next(content for content in [self.content, *others] if content.id not in drawn)
+        deactivated.is_active = False
+        deactivated.save()
+        retired.is_active = True
+        retired.save()
+
+        drawn += draw_content_ids(self.user.pk, count=3)
+        self.assertIn(retired.id, drawn)
+        self.assertNotIn(deactivated.id, drawn)
+        self.assertEqual(len(drawn), len(set(drawn)))
+
+
+class DeprecatedRecordCreateTest(RecordTestCase):
+    def test_username_must_match_token_profile(self):
+        other = CommonProfile.objects.create(user=User.objects.create_user('b@wake.com', 'pw'), name='b')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {CachedSlidingToken.for_user(self.user)}')
+
+        def create(username):
+            data = dict(content_id=self.content.id, text='a', username=username)
+            return self.client.post('/api/records/records/create/', data, format='json')
+
+        response = create(other.name)
+        self.assertEqual(response.status_code, 400, response.content)
+        self.assertFalse(Record.objects.exists())
+
+        response = create('nobody')
+        self.assertEqual(response.status_code, 400, response.content)
+
+        response = create(self.profile.name)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(Record.objects.get().profile_id, self.profile.id)
@@ -0,0 +1,53 @@
+import datetime
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.http import parse_etags
+
+from records.projection import project_records, records_to_representation
+
+
+def build_timeline(queryset, date_st: datetime.date, date_end: datetime.date) -> list:
+    """
+    queryset은 record_date(KST 기준 날짜)가 annotate 되어 있어야 합니다.
+    record를 한 번만 순회하며 날짜별로 묶고, date_st ~ date_end의 모든 날짜를 채워 return
+    """
+    rows = list(project_records(queryset, 'record_date'))
+    serialized = records_to_representation(rows)
+
+    records_by_date = {}
+    for row, data in zip(rows, serialized):
+        records_by_date.setdefault(row.record_date, []).append(data)
+
+    results = []
+    while date_st <= date_end:
+        results.append(dict(
+            date=date_st.strftime('%Y-%m-%d'),
+            records=records_by_date.get(date_st, [])
+        ))
+        date_st += datetime.timedelta(days=1)
+    return results
+
+
+def timeline_etag(queryset, date_st: datetime.date, date_end: datetime.date) -> str:
+    """
+    record 전체를 serialize 하지 않고 index 범위 aggregate 한 번으로 strong etag 생성
+    - 조회 구간이 다르면 빈 timeline이라도 응답이 다르므로 날짜를 포함
+    - content 문구 수정도 응답을 바꾸므로 content의 updated_at도 포함
+    """
+    aggregated = queryset.order_by().aggregate(
+        count=Count('id'),
+        last_id=Max('id'),
+        last_updated_at=Max('updated_at'),
+        content_updated_at=Max('content__updated_at'),
+    )
+    raw = '|'.join(str(value) for value in (
+        date_st, date_end,
+        aggregated['count'], aggregated['last_id'], aggregated['last_updated_at'], aggregated['content_updated_at'],
+    ))
+    return '"%s"' % hashlib.md5(raw.encode()).hexdigest()
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    etags = parse_etags(if_none_match)
+    return '*' in etags or etag in etags
@@ -1,50 +1,102 @@
 import datetime
+from typing import Optional
 
-from django.db.models import Q
+from django.db.models import Count
 from django.db.models.functions import TruncDate
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_cache_control
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets, status, mixins
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListAPIView, GenericAPIView, CreateAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from records.cache import get_timeline, invalidate_timeline
+from records.catalog import get_catalog_version, catalog_etag, get_catalog
+from records.export import stream_csv, stream_ndjson
 from records.models import Record, Content
+from records.pagination import RecordCursorPagination
+from records.random_content import random_content, draw_content, draw_contents, active_content_ids
+from records.projection import project_records, records_to_representation, record_to_row
+from records.timeline import etag_matches
 from records.serializer import RecordSerializer, ContentSerializer, RecordCreateSerializer, RecordListQuerySerializer, \
-    RandomContentQuerySerializer, RecordListSerializer, CreateRecordSerializer
+    RandomContentQuerySerializer, RecordListSerializer, CreateRecordSerializer, RecordCalendarQuerySerializer, \
+    RecordCalendarSerializer, RecordExportQuerySerializer, ContentCatalogQuerySerializer, ContentCatalogSerializer
 from accounts.models import CommonProfile
+from accounts.tokens import PROFILE_ID_CLAIM
+from accounts.utils import get_profile_id
+from core.utils.time import TimeManager
 from utils.time import KST
 
+CLOSED_TIMELINE_MAX_AGE = 60 * 60 * 24 * 30
+RECORD_BATCH_CREATE_MAX_SIZE = 100
+
+
+def get_content_text(record: Record) -> str:
+    # active content는 process 단위 배열에서, 없으면 (비활성 등) 조회
+    content_text = active_content_ids.get_text(record.content_id)
+    if content_text is None:
+        content_text = record.content.text
+    return content_text
+
 
 class ContentViewSet(viewsets.GenericViewSet):
     model = Record
     serializer_class = ContentSerializer
     permission_classes = [IsAuthenticated]
 
-    def get_prev_filter(self) -> Q:
-        prev = self.request.query_params.get('prev')
-        if not prev:
-            return Q()
-        return ~Q(id=int(prev))
-
     @swagger_auto_schema(
         operation_summary="랜덤 질문 조회 API",
         query_serializer=RandomContentQuerySerializer
     )
     @action(methods=['GET'], detail=False)
     def random(self, request, *args, **kwargs):
-        prev_filter = self.get_prev_filter()
-        queryset = Content.objects.filter(
-            prev_filter
-        ).order_by(
-            '?'
-        ).first()
-
-        serializer = self.get_serializer(queryset)
+        query_serializer = RandomContentQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        prev = query_serializer.validated_data.get('prev')
+        count = query_serializer.validated_data.get('count')
+
+        if count is None:
+            content = draw_content(request.user.pk, prev=prev)
+            serializer = self.get_serializer(content)
+            return Response(serializer.data)
+
+        exclude = query_serializer.validated_data.get('exclude', [])
+        if prev is not None:
+            exclude.append(prev)
+        contents = draw_contents(request.user.pk, count, exclude=exclude)
+        serializer = self.get_serializer(contents, many=True)
         return Response(serializer.data)
 
+    @swagger_auto_schema(
+        operation_summary="질문 목록 조회 API",
+        operation_description="active 질문 전체와 catalog version을 조회합니다. "
+                              "since_version 지정 시 이후 변경/비활성화된 질문만 return 합니다.",
+        query_serializer=ContentCatalogQuerySerializer,
+        responses={status.HTTP_200_OK: ContentCatalogSerializer}
+    )
+    @action(methods=['GET'], detail=False)
+    def catalog(self, request, *args, **kwargs):
+        query_serializer = ContentCatalogQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        since_version = query_serializer.validated_data.get('since_version')
+
+        version, count = get_catalog_version()
+        etag = catalog_etag(version, count, since_version)
+
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None and etag_matches(etag, if_none_match):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(get_catalog(version, count, since_version))
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
 
 @extend_schema(tags=["Record Domain"])
 class RecordViewSet(
@@ -54,8 +106,27 @@ class RecordViewSet(
     model = Record
     serializer_class = RecordListSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = RecordCursorPagination
+
+    def get_serializer_class(self):
+        if self.action in ('create', 'batch'):
+            return CreateRecordSerializer
+        return super().get_serializer_class()
+
+    def is_range_query(self) -> bool:
+        return 'from' in self.request.query_params
+
+    def get_range_dates(self) -> (datetime.date, datetime.date):
+        query_serializer = RecordListQuerySerializer(data=self.request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        date_from = query_serializer.validated_data['from']
+        date_to = query_serializer.validated_data.get('to') or datetime.datetime.today().astimezone(tz=KST).date()
+        return date_from, date_to
 
     def get_target_dates(self) -> (datetime.date, datetime.date):
+        if self.is_range_query():
+            return self.get_range_dates()
+
         q_target_date = self.request.query_params.get('target_date')
         if q_target_date:
             target_date_end = datetime.datetime.strptime(q_target_date, '%Y-%m-%d').date()
@@ -67,21 +138,31 @@ class RecordViewSet(
     def get_queryset(self):
         target_date_st, target_date_end = self.get_target_dates()
 
+        created_at_st, created_at_end = TimeManager.date_range_to_utc(target_date_st, target_date_end)
+
         queryset = Record.objects.filter(
-            profile__user=self.request.user
+            profile__user=self.request.user,
+            created_at__gte=created_at_st,
+            created_at__lt=created_at_end,
         ).annotate(
             record_date=TruncDate('created_at', tzinfo=KST)
-        ).filter(
-            record_date__gte=target_date_st,
-            record_date__lte=target_date_end
         ).select_related(
             'content'
         ).order_by(
-            'created_at'
+            'created_at', 'id'
         )
 
         return queryset
 
+    def set_timeline_cache_headers(self, response: Response, etag: str, target_date_end: datetime.date) -> Response:
+        response['ETag'] = etag
+        if target_date_end < TimeManager.today().date():
+            # record의 created_at은 항상 생성 시각이므로 지난 기간의 timeline은 바뀌지 않음
+            patch_cache_control(response, private=True, max_age=CLOSED_TIMELINE_MAX_AGE, immutable=True)
+        else:
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
     @extend_schema(
         request=RecordCreateSerializer,
         summary="기록 조회 API",
@@ -97,21 +178,18 @@ class RecordViewSet(
         target_date_st, target_date_end = self.get_target_dates()
         queryset = self.filter_queryset(self.get_queryset())
 
-        serializer = RecordSerializer(queryset, many=True)
-        records = serializer.data
-
-        results = []
-        while target_date_st <= target_date_end:
-            results.append(dict(
-                date=target_date_st.strftime('%Y-%m-%d'),
-                records=list(filter(
-                    lambda x: datetime.datetime.fromisoformat(x.get('created_at')).astimezone(
-                        KST).date() == target_date_st,
-                    records
-                ))
-            ))
-            target_date_st += datetime.timedelta(days=1)
-        return Response(results)
+        if self.is_range_query():
+            # 기간 조회는 (created_at, id) cursor로 page 단위 응답
+            page = self.paginate_queryset(project_records(queryset))
+            return self.get_paginated_response(records_to_representation(page))
+
+        if_none_match = request.headers.get('If-None-Match')
+        etag, results = get_timeline(request.user.pk, queryset, target_date_st, target_date_end, if_none_match)
+        if results is None or (if_none_match is not None and etag_matches(etag, if_none_match)):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(results)
+        return self.set_timeline_cache_headers(response, etag, target_date_end)
 
     @extend_schema(
         request=RecordCreateSerializer,
@@ -132,17 +210,129 @@ class RecordViewSet(
         content_id = serializer.validated_data.get('content_id')
         text = serializer.validated_data.get('text')
 
-        profile = request.user.common_profile
-
+        # token의 profile id claim을 사용하므로 INSERT 한 번으로 생성
         record = Record.objects.create(
             content_id=content_id,
-            profile=profile,
+            profile_id=get_profile_id(request),
             text=text
         )
+        invalidate_timeline(request.user.pk)
+
+        return Response(records_to_representation([record_to_row(record, get_content_text(record))])[0])
+
+    @extend_schema(
+        request=CreateRecordSerializer(many=True),
+        summary="기록 일괄 생성 API",
+        description="오프라인 동안 쌓인 기록을 한 번에 생성합니다. 요청 순서대로 생성된 기록을 return 합니다.",
+        responses={status.HTTP_200_OK: RecordSerializer(many=True)},
+    )
+    @swagger_auto_schema(
+        operation_summary="기록 일괄 생성 API",
+        request_body=CreateRecordSerializer(many=True),
+        responses={status.HTTP_200_OK: RecordSerializer(many=True)}
+    )
+    @action(methods=['POST'], detail=False)
+    def batch(self, request, *args, **kwargs):
+        serializer = self.get_serializer(
+            data=request.data, many=True, allow_empty=False, max_length=RECORD_BATCH_CREATE_MAX_SIZE
+        )
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data
+
+        content_ids = {item['content_id'] for item in items}
+        content_texts = dict(Content.objects.filter(id__in=content_ids).values_list('id', 'text'))
+        missing_content_ids = content_ids - content_texts.keys()
+        if missing_content_ids:
+            raise ValidationError({'content_id': f'Content does not exist: {sorted(missing_content_ids)}'})
+
+        profile_id = get_profile_id(request)
+
+        records = Record.objects.bulk_create_returning([
+            Record(content_id=item['content_id'], profile_id=profile_id, text=item.get('text'))
+            for item in items
+        ])
+        invalidate_timeline(request.user.pk)
+
+        rows = [record_to_row(record, content_texts[record.content_id]) for record in records]
+        return Response(records_to_representation(rows))
+
+    @extend_schema(
+        summary="기록 캘린더 조회 API",
+        description="월/년 단위로 날짜별 기록 개수를 조회합니다. 기록이 없는 날짜는 포함하지 않습니다.",
+        parameters=[RecordCalendarQuerySerializer],
+        responses={status.HTTP_200_OK: RecordCalendarSerializer},
+    )
+    @swagger_auto_schema(
+        operation_summary="기록 캘린더 조회 API",
+        query_serializer=RecordCalendarQuerySerializer,
+        responses={status.HTTP_200_OK: RecordCalendarSerializer}
+    )
+    @action(methods=['GET'], detail=False, pagination_class=None)
+    def calendar(self, request, *args, **kwargs):
+        query_serializer = RecordCalendarQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        year = query_serializer.validated_data.get('year')
+        month = query_serializer.validated_data.get('month')
+
+        if year:
+            date_from = datetime.date(int(year), 1, 1)
+            date_to = datetime.date(int(year), 12, 31)
+        else:
+            if month:
+                month_from = datetime.datetime.strptime(month, '%Y-%m')
+            else:
+                month_from = TimeManager.today()
+            date_from = TimeManager.this_month(month_from).date()
+            date_to = TimeManager.this_month(month_from, end=True).date() - datetime.timedelta(days=1)
+
+        created_at_st, created_at_end = TimeManager.date_range_to_utc(date_from, date_to)
+
+        # record 본문 없이 (profile, created_at) index 범위에서 KST 날짜별 개수만 집계
+        days = Record.objects.filter(
+            profile__user=request.user,
+            created_at__gte=created_at_st,
+            created_at__lt=created_at_end,
+        ).annotate(
+            record_date=TruncDate('created_at', tzinfo=KST)
+        ).values(
+            'record_date'
+        ).annotate(
+            count=Count('id')
+        ).order_by(
+            'record_date'
+        ).values_list(
+            'record_date', 'count'
+        )
 
-        record_serializer = RecordSerializer(record)
+        return Response(dict(
+            date_from=date_from.strftime('%Y-%m-%d'),
+            date_to=date_to.strftime('%Y-%m-%d'),
+            days=[dict(date=record_date.strftime('%Y-%m-%d'), count=count) for record_date, count in days]
+        ))
 
-        return Response(record_serializer.data)
+    @extend_schema(
+        summary="기록 전체 내보내기 API",
+        description="전체 기록을 ndjson(기본) 또는 csv로 streaming 합니다.",
+        parameters=[RecordExportQuerySerializer],
+    )
+    @swagger_auto_schema(
+        operation_summary="기록 전체 내보내기 API",
+        query_serializer=RecordExportQuerySerializer,
+    )
+    @action(methods=['GET'], detail=False, pagination_class=None)
+    def export(self, request, *args, **kwargs):
+        query_serializer = RecordExportQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        export_type = query_serializer.validated_data.get('type', 'ndjson')
+
+        queryset = Record.objects.filter(profile__user=request.user)
+
+        if export_type == 'csv':
+            response = StreamingHttpResponse(stream_csv(queryset), content_type='text/csv; charset=utf-8')
+        else:
+            response = StreamingHttpResponse(stream_ndjson(queryset), content_type='application/x-ndjson')
+        response['Content-Disposition'] = f'attachment; filename="records.{export_type}"'
+        return response
 
 
 # deprecated under
@@ -151,22 +341,17 @@ class RecordViewSet(
 class RandomContentAPIView(GenericAPIView):
     serializer_class = ContentSerializer
 
-    def get_prev_filter(self) -> Q:
+    def get_prev(self) -> Optional[int]:
         prev = self.request.query_params.get('prev')
         if not prev:
-            return Q()
-        return ~Q(id=int(prev))
+            return None
+        return int(prev)
 
     @swagger_auto_schema(deprecated=True, operation_description="to [GET] api/records/content/random/")
     def get(self, request: Request):
-        prev_filter = self.get_prev_filter()
-        queryset = Content.objects.filter(
-            prev_filter
-        ).order_by(
-            '?'
-        ).first()
+        content = random_content(prev=self.get_prev())
 
-        serializer = self.get_serializer(queryset)
+        serializer = self.get_serializer(content)
         return Response(serializer.data)
 
 
@@ -179,6 +364,10 @@ class RecordCreateAPIView(CreateAPIView):
         operation_description="to [POST] api/records/"
     )
     def post(self, request: Request, *args, **kwargs):
+        """
+        username의 profile에 기록 생성
+        token에 profile id claim이 있는데 username의 profile과 다르면 400
+        """
         serializer: RecordCreateSerializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -186,17 +375,22 @@ class RecordCreateAPIView(CreateAPIView):
         content_id = serializer.validated_data.get('content_id')
         text = serializer.validated_data.get('text')
 
-        profile = CommonProfile.objects.get(name=username)
+        profile = CommonProfile.objects.filter(name=username).values_list('id', 'user_id').first()
+        if profile is None:
+            raise ValidationError({'username': 'Profile does not exist'})
+        profile_id, user_id = profile
+        token_profile_id = request.auth.get(PROFILE_ID_CLAIM) if request.auth is not None else None
+        if token_profile_id is not None and token_profile_id != profile_id:
+            raise ValidationError({'username': 'Does not match the authenticated profile'})
 
         record = Record.objects.create(
             content_id=content_id,
-            profile=profile,
+            profile_id=profile_id,
             text=text
         )
+        invalidate_timeline(user_id)
 
-        record_serializer = RecordSerializer(record)
-
-        return Response(record_serializer.data)
+        return Response(records_to_representation([record_to_row(record, get_content_text(record))])[0])
 
 
 class RecordListAPIView(ListAPIView):
@@ -215,13 +409,14 @@ class RecordListAPIView(ListAPIView):
     def get_queryset(self):
         target_date_st, target_date_end = self.get_target_dates()
 
+        created_at_st, created_at_end = TimeManager.date_range_to_utc(target_date_st, target_date_end)
+
         queryset = Record.objects.filter(
-            profile__user=self.request.user
+            profile__user=self.request.user,
+            created_at__gte=created_at_st,
+            created_at__lt=created_at_end,
         ).annotate(
             record_date=TruncDate('created_at', tzinfo=KST)
-        ).filter(
-            record_date__gte=target_date_st,
-            record_date__lte=target_date_end
         ).select_related(
             'content'
         ).order_by(
@@ -234,20 +429,7 @@ class RecordListAPIView(ListAPIView):
         target_date_st, target_date_end = self.get_target_dates()
         queryset = self.filter_queryset(self.get_queryset())
 
-        serializer = RecordSerializer(queryset, many=True)
-        records = serializer.data
-
-        results = []
-        while target_date_st <= target_date_end:
-            results.append(dict(
-                date=target_date_st.strftime('%Y-%m-%d'),
-                records=list(filter(
-                    lambda x: datetime.datetime.fromisoformat(x.get('created_at')).astimezone(
-                        KST).date() == target_date_st,
-                    records
-                ))
-            ))
-            target_date_st += datetime.timedelta(days=1)
+        _, results = get_timeline(request.user.pk, queryset, target_date_st, target_date_end)
         return Response(results)
 
     @swagger_auto_schema(
@@ -0,0 +1,92 @@
+"""
+ASGI 전용 kakao callback / resign (KaKaoLoginViewSet의 async 버전)
+kakao 요청을 기다리는 동안 thread를 잡지 않으므로 동시 로그인 수가 thread 수에 묶이지 않습니다.
+"""
+
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+from rest_framework.exceptions import AuthenticationFailed
+
+from accounts.authentication import CachedJWTAuthentication, user_cache
+from accounts.models import User
+from accounts.utils import token_serializer
+from jobs.queue import aenqueue
+from social_app.jobs import unlink_kakao_account
+from social_app.kakao import KakaoAPIError, KakaoUnavailableError
+from social_app.kakao_async import async_kakao_client
+from social_app.signup import kakao_signup
+from social_app.views import login_redirect
+
+
+async def authenticate_jwt(request):
+    """
+    (user, token) 또는 None
+    user cache hit면 DB 조회가 없지만 blacklist 동기화 등 sync ORM을 쓸 수 있으므로 sync_to_async로 실행
+    """
+    try:
+        return await sync_to_async(CachedJWTAuthentication().authenticate)(request)
+    except AuthenticationFailed:
+        return None
+
+
+def login_or_signup(request, kakao_user) -> dict:
+    """
+    유저가 이미 디비에 있으면 그대로, 없으면 유저 및 프로필 생성 후 token_serializer 결과
+    """
+    user = User.objects.filter(email=kakao_user.email).first()
+    if user is None:
+        user = kakao_signup(request, kakao_user)
+    return token_serializer(user)
+
+
+async def delete_social_accounts(user):
+    kakao_uid = await user.socialaccount_set.filter(provider='kakao').values_list('uid', flat=True).afirst()
+    # async ORM에서는 transaction.atomic을 쓸 수 없으므로 unlink job을 먼저 등록
+    # (삭제가 실패해도 kakao 연결만 끊기고, 다시 로그인하면 email로 같은 user를 찾음)
+    if kakao_uid is not None:
+        await aenqueue(unlink_kakao_account, kakao_uid=int(kakao_uid))
+    await user.socialaccount_set.all().adelete()
+
+
+@require_GET
+async def kakao_callback(request):
+    code = request.GET.get('code')
+    if not code:
+        return HttpResponse(status=400)
+
+    # kakao에 access token 발급 요청 후 user info 요청
+    try:
+        kakao_token = await async_kakao_client.get_token(code)
+        kakao_user = await async_kakao_client.get_user(kakao_token.access_token)
+    except KakaoUnavailableError:
+        return HttpResponse(status=503)
+    except KakaoAPIError:
+        return HttpResponse(status=400)
+
+    # 유저 조회 / 가입 / 토큰 발행은 sync ORM과 transaction을 쓰므로 한 번의 sync_to_async로 묶어서 실행
+    try:
+        token = await sync_to_async(login_or_signup)(request, kakao_user)
+    except IntegrityError:
+        return JsonResponse({"err_msg": "failed to signin"}, status=400)
+    return login_redirect(token)
+
+
+@csrf_exempt
+@require_POST
+async def kakao_resign(request):
+    authenticated = await authenticate_jwt(request)
+    if authenticated is None:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+    user, token = authenticated
+
+    # todo: 일단 kakao만 구현했으므로
+    # kakao unlink는 응답을 기다리지 않도록 worker(manage.py run_jobs)에서 실행
+    await delete_social_accounts(user)
+
+    await token.ablacklist()
+    await user_cache.ainvalidate(user.pk)
+
+    return JsonResponse(dict(message='logout succeeded'))
@@ -0,0 +1,21 @@
+"""
+jobs.queue.enqueue로 등록해 manage.py run_jobs worker에서 실행하는 작업
+"""
+import logging
+
+from social_app.kakao import kakao_client, KakaoAPIError, KakaoUnavailableError
+
+logger = logging.getLogger(__name__)
+
+
+def unlink_kakao_account(kakao_uid: int):
+    """
+    탈퇴한 유저의 kakao 연결 끊기
+    timeout / 5xx(KakaoUnavailableError)는 그대로 raise해서 재시도, 4xx(이미 끊긴 user 등)는 재시도하지 않음
+    """
+    try:
+        kakao_client.unlink(kakao_uid)
+    except KakaoUnavailableError:
+        raise
+    except KakaoAPIError as e:
+        logger.warning('kakao unlink failed: %s', e)
@@ -0,0 +1,234 @@
+import threading
+import time
+from typing import Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from typeguard import TypeCheckError
+from urllib3.util.retry import Retry
+
+from dtos.social_app import KakaoOauthTokenOutputDTO, KakaoUserOutputDTO, KakaoUnlinkOutputDTO
+
+# connect / read timeout (초), 느린 kakao 응답이 uwsgi thread를 계속 잡고 있지 않도록 합니다.
+KAKAO_CONNECT_TIMEOUT = 3.05
+KAKAO_READ_TIMEOUT = 5
+# process 당 thread 수(uwsgi threads)만큼 keep-alive connection 유지
+KAKAO_POOL_MAXSIZE = 100
+# 연결 실패는 모든 method, 응답 지연 / 5xx는 GET만 재시도 (인가 코드는 한 번만 사용 가능)
+KAKAO_MAX_RETRIES = 2
+KAKAO_RETRY_BACKOFF = 0.1
+KAKAO_RETRY_STATUS = (502, 503, 504)
+# 연속으로 이만큼 실패하면 KAKAO_CIRCUIT_RESET_TIMEOUT 동안 요청하지 않고 바로 실패
+KAKAO_CIRCUIT_FAILURE_THRESHOLD = 5
+KAKAO_CIRCUIT_RESET_TIMEOUT = 30
+
+TOKEN_REQUEST_HEADERS = {'Content-type': 'application/x-www-form-urlencoded;charset=utf-8'}
+
+
+class KakaoAPIError(Exception):
+    def __init__(self, status_code: Optional[int], detail):
+        super().__init__(f'kakao api error ({status_code}): {detail}')
+        self.status_code = status_code
+        self.detail = detail
+
+
+class KakaoUnavailableError(KakaoAPIError):
+    """
+    timeout, 연결 실패, 5xx, circuit open
+    """
+
+
+def parse_token(payload: dict) -> KakaoOauthTokenOutputDTO:
+    try:
+        return KakaoOauthTokenOutputDTO(
+            token_type=payload['token_type'],
+            access_token=payload['access_token'],
+            expires_in=payload['expires_in'],
+            refresh_token=payload['refresh_token'],
+            refresh_token_expires_in=payload['refresh_token_expires_in'],
+            scope=payload.get('scope', '').split(),
+        )
+    except (KeyError, TypeError, AttributeError, TypeCheckError) as e:
+        raise KakaoAPIError(200, f'unexpected token response: {e}')
+
+
+def parse_user(payload: dict) -> KakaoUserOutputDTO:
+    try:
+        kakao_account = payload.get('kakao_account') or {}
+        profile = kakao_account.get('profile') or {}
+        return KakaoUserOutputDTO(
+            id=payload['id'],
+            email=kakao_account.get('email'),
+            nickname=profile.get('nickname'),
+            extra_data=payload,
+        )
+    except (KeyError, TypeError, AttributeError, TypeCheckError) as e:
+        raise KakaoAPIError(200, f'unexpected user response: {e}')
+
+
+def parse_unlink(payload: dict) -> KakaoUnlinkOutputDTO:
+    try:
+        return KakaoUnlinkOutputDTO(id=payload['id'])
+    except (KeyError, TypeError, TypeCheckError) as e:
+        raise KakaoAPIError(200, f'unexpected unlink response: {e}')
+
+
+def token_request_data(code: str) -> dict:
+    return {
+        'grant_type': 'authorization_code',
+        'client_id': settings.KAKAO_REST_API_KEY,
+        'redirect_uri': settings.KAKAO_CALLBACK_URI,
+        'code': code,
+        'client_secret': settings.KAKAO_CLIENT_SECRET,
+    }
+
+
+def unlink_request_data(kakao_uid: int) -> dict:
+    return {'target_id_type': 'user_id', 'target_id': kakao_uid}
+
+
+def admin_headers() -> dict:
+    return {
+        'Content-Type': 'application/x-www-form-urlencoded',
+        'Authorization': f'KakaoAK {settings.KAKAO_ADMIN_KEY}',
+    }
+
+
+def read_response(breaker: 'CircuitBreaker', response) -> dict:
+    """
+    requests / httpx response 공통 처리: 5xx는 circuit 실패로 기록, 4xx는 KakaoAPIError
+    """
+    if response.status_code >= 500:
+        breaker.record_failure()
+        raise KakaoUnavailableError(response.status_code, response.text[:200])
+    breaker.record_success()
+
+    try:
+        payload = response.json()
+    except ValueError:
+        raise KakaoAPIError(response.status_code, response.text[:200])
+    if response.status_code >= 400:
+        raise KakaoAPIError(response.status_code, payload)
+    return payload
+
+
+class CircuitBreaker:
+    """
+    closed -> (연속 실패 failure_threshold번) -> open -> (reset_timeout 후) half-open
+    half-open에서는 요청 하나만 보내보고 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, failure_threshold: int = KAKAO_CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = KAKAO_CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class KakaoClient:
+    """
+    kauth / kapi.kakao.com client
+    - process 단위 Session으로 connection을 재사용하고 모든 요청에 timeout 적용
+    - 응답은 dtos.social_app의 DTO로 변환
+    """
+
+    def __init__(self, auth_host: Optional[str] = None, api_host: Optional[str] = None,
+                 timeout=(KAKAO_CONNECT_TIMEOUT, KAKAO_READ_TIMEOUT), breaker: Optional[CircuitBreaker] = None):
+        self._auth_host = auth_host
+        self._api_host = api_host
+        self.timeout = timeout
+        self.breaker = breaker or CircuitBreaker()
+
+        retry = Retry(
+            total=KAKAO_MAX_RETRIES,
+            connect=KAKAO_MAX_RETRIES,
+            read=KAKAO_MAX_RETRIES,
+            status=KAKAO_MAX_RETRIES,
+            allowed_methods=frozenset({'GET'}),
+            status_forcelist=KAKAO_RETRY_STATUS,
+            backoff_factor=KAKAO_RETRY_BACKOFF,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=KAKAO_POOL_MAXSIZE, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @property
+    def auth_host(self) -> str:
+        return self._auth_host or settings.KAKAO_AUTH_HOST
+
+    @property
+    def api_host(self) -> str:
+        return self._api_host or settings.KAKAO_API_HOST
+
+    def request(self, method: str, url: str, **kwargs) -> dict:
+        if not self.breaker.allow():
+            raise KakaoUnavailableError(None, 'circuit open')
+
+        try:
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        except requests.RequestException as e:
+            self.breaker.record_failure()
+            raise KakaoUnavailableError(None, e) from e
+
+        return read_response(self.breaker, response)
+
+    def get_token(self, code: str) -> KakaoOauthTokenOutputDTO:
+        payload = self.request(
+            'POST',
+            f'{self.auth_host}/oauth/token',
+            data=token_request_data(code),
+            headers=TOKEN_REQUEST_HEADERS,
+        )
+        return parse_token(payload)
+
+    def get_user(self, access_token: str) -> KakaoUserOutputDTO:
+        payload = self.request(
+            'GET',
+            f'{self.api_host}/v2/user/me',
+            headers={'Authorization': f'Bearer {access_token}'},
+        )
+        return parse_user(payload)
+
+    def unlink(self, kakao_uid: int) -> KakaoUnlinkOutputDTO:
+        payload = self.request(
+            'POST',
+            f'{self.api_host}/v1/user/unlink',
+            data=unlink_request_data(kakao_uid),
+            headers=admin_headers(),
+        )
+        return parse_unlink(payload)
+
+
+kakao_client = KakaoClient()
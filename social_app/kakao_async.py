@@ -0,0 +1,126 @@
+import asyncio
+import itertools
+import weakref
+from typing import Optional
+
+import httpx
+from django.conf import settings
+
+from dtos.social_app import KakaoOauthTokenOutputDTO, KakaoUserOutputDTO, KakaoUnlinkOutputDTO
+from social_app.kakao import KAKAO_CONNECT_TIMEOUT, KAKAO_READ_TIMEOUT, KAKAO_MAX_RETRIES, KAKAO_RETRY_BACKOFF, \
+    KAKAO_RETRY_STATUS, TOKEN_REQUEST_HEADERS, CircuitBreaker, KakaoUnavailableError, kakao_client, read_response, \
+    parse_token, parse_user, parse_unlink, token_request_data, unlink_request_data, admin_headers
+
+# event loop 당 동시 kakao 요청 수 = SHARDS * CONNECTIONS
+# httpcore pool은 요청이 들어오고 나갈 때마다 connection 수의 제곱만큼 상태를 확인하므로
+# pool 하나를 크게 잡지 않고 작은 pool 여러 개에 round robin, pool 앞에서 semaphore로 대기열을 비워 둠
+ASYNC_KAKAO_POOL_SHARDS = 10
+ASYNC_KAKAO_MAX_CONNECTIONS = 20
+
+
+class AsyncKakaoClient:
+    """
+    KakaoClient의 asyncio 버전 (httpx.AsyncClient)
+    - timeout / 재시도 / DTO 변환 규칙은 KakaoClient와 같고 circuit breaker 상태도 공유
+    - httpx.AsyncClient / semaphore는 event loop에 묶이므로 loop 별로 만듦 (ASGI에서는 worker 당 한 벌)
+    """
+
+    def __init__(self, auth_host: Optional[str] = None, api_host: Optional[str] = None,
+                 timeout=(KAKAO_CONNECT_TIMEOUT, KAKAO_READ_TIMEOUT), breaker: Optional[CircuitBreaker] = None):
+        self._auth_host = auth_host
+        self._api_host = api_host
+        self.timeout = timeout
+        self.breaker = breaker or kakao_client.breaker
+        self._clients = weakref.WeakKeyDictionary()
+
+    @property
+    def auth_host(self) -> str:
+        return self._auth_host or settings.KAKAO_AUTH_HOST
+
+    @property
+    def api_host(self) -> str:
+        return self._api_host or settings.KAKAO_API_HOST
+
+    def create_shard(self) -> tuple:
+        connect_timeout, read_timeout = self.timeout
+        limits = httpx.Limits(
+            max_connections=ASYNC_KAKAO_MAX_CONNECTIONS,
+            max_keepalive_connections=ASYNC_KAKAO_MAX_CONNECTIONS,
+        )
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout, pool=connect_timeout),
+            # transport 재시도는 연결 실패만 (모든 method)
+            transport=httpx.AsyncHTTPTransport(retries=KAKAO_MAX_RETRIES, limits=limits),
+        )
+        return client, asyncio.Semaphore(ASYNC_KAKAO_MAX_CONNECTIONS)
+
+    def get_http_client(self) -> tuple:
+        """
+        현재 loop의 (httpx.AsyncClient, asyncio.Semaphore) 중 하나 (round robin)
+        """
+        loop = asyncio.get_running_loop()
+        shards = self._clients.get(loop)
+        if shards is None:
+            shards = self._clients[loop] = itertools.cycle(
+                [self.create_shard() for _ in range(ASYNC_KAKAO_POOL_SHARDS)]
+            )
+        return next(shards)
+
+    async def request(self, method: str, url: str, **kwargs) -> dict:
+        if not self.breaker.allow():
+            raise KakaoUnavailableError(None, 'circuit open')
+
+        client, semaphore = self.get_http_client()
+        async with semaphore:
+            return await self._request(client, method, url, **kwargs)
+
+    async def _request(self, client: httpx.AsyncClient, method: str, url: str, **kwargs) -> dict:
+        # 응답 지연 / 5xx는 GET만 재시도 (인가 코드는 한 번만 사용 가능)
+        attempts = KAKAO_MAX_RETRIES + 1 if method == 'GET' else 1
+        for attempt in range(attempts):
+            is_last = attempt + 1 == attempts
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.TimeoutException as e:
+                if not is_last:
+                    await asyncio.sleep(KAKAO_RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                self.breaker.record_failure()
+                raise KakaoUnavailableError(None, e) from e
+            except httpx.HTTPError as e:
+                self.breaker.record_failure()
+                raise KakaoUnavailableError(None, e) from e
+
+            if response.status_code in KAKAO_RETRY_STATUS and not is_last:
+                await asyncio.sleep(KAKAO_RETRY_BACKOFF * 2 ** attempt)
+                continue
+            return read_response(self.breaker, response)
+
+    async def get_token(self, code: str) -> KakaoOauthTokenOutputDTO:
+        payload = await self.request(
+            'POST',
+            f'{self.auth_host}/oauth/token',
+            data=token_request_data(code),
+            headers=TOKEN_REQUEST_HEADERS,
+        )
+        return parse_token(payload)
+
+    async def get_user(self, access_token: str) -> KakaoUserOutputDTO:
+        payload = await self.request(
+            'GET',
+            f'{self.api_host}/v2/user/me',
+            headers={'Authorization': f'Bearer {access_token}'},
+        )
+        return parse_user(payload)
+
+    async def unlink(self, kakao_uid: int) -> KakaoUnlinkOutputDTO:
+        payload = await self.request(
+            'POST',
+            f'{self.api_host}/v1/user/unlink',
+            data=unlink_request_data(kakao_uid),
+            headers=admin_headers(),
+        )
+        return parse_unlink(payload)
+
+
+async_kakao_client = AsyncKakaoClient()
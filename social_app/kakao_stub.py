@@ -0,0 +1,217 @@
+"""
+kakao api local stub server (kauth / kapi를 한 server에서 흉내)
+
+    python -m social_app.kakao_stub --port 8089 --delay 0.5 --fail-rate 0.1
+    python -m social_app.kakao_stub --port 8089 --delay 0.5 --async  # 동시 연결 수천 개용 asyncio server
+    KAKAO_AUTH_HOST=http://127.0.0.1:8089 KAKAO_API_HOST=http://127.0.0.1:8089 python manage.py runserver
+
+- POST /oauth/token     code -> access token (code가 'invalid'이면 400 KOE320)
+- GET  /v2/user/me      access token -> user (email: {code}@kakao.stub)
+- POST /v1/user/unlink  target_id -> id
+- --delay: 모든 응답 지연(초), --fail-rate: 503 응답 비율
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+STUB_TOKEN_PREFIX = 'stub-access-'
+
+
+def kakao_uid(code: str) -> int:
+    return int(hashlib.md5(code.encode()).hexdigest()[:12], 16)
+
+
+def stub_response(method: str, path: str, authorization: str, body: str, fail_rate: float = 0.0) -> tuple:
+    """
+    (status, payload)
+    """
+    if fail_rate and random.random() < fail_rate:
+        return 503, {'msg': 'stub unavailable', 'code': -9798}
+    form = {key: values[0] for key, values in parse_qs(body).items()}
+
+    if method == 'POST' and path == '/oauth/token':
+        code = form.get('code', '')
+        if not code or code == 'invalid':
+            return 400, {'error': 'invalid_grant', 'error_code': 'KOE320'}
+        return 200, {
+            'token_type': 'bearer',
+            'access_token': STUB_TOKEN_PREFIX + code,
+            'expires_in': 21599,
+            'refresh_token': 'stub-refresh-' + code,
+            'refresh_token_expires_in': 5183999,
+            'scope': 'account_email profile_nickname',
+        }
+    if method == 'POST' and path == '/v1/user/unlink':
+        return 200, {'id': int(form.get('target_id', 0))}
+    if method == 'GET' and path.startswith('/v2/user/me'):
+        token = authorization.removeprefix('Bearer ')
+        if not token.startswith(STUB_TOKEN_PREFIX):
+            return 401, {'msg': 'this access token does not exist', 'code': -401}
+        code = token.removeprefix(STUB_TOKEN_PREFIX)
+        return 200, {
+            'id': kakao_uid(code),
+            'properties': {'nickname': code[:20]},
+            'kakao_account': {
+                'email': f'{code}@kakao.stub',
+                'is_email_valid': True,
+                'is_email_verified': True,
+                'profile': {'nickname': code[:20]},
+            },
+        }
+    return 404, {'msg': 'not found', 'code': -1}
+
+
+class KakaoStubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    delay = 0.0
+    fail_rate = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle_stub(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode()
+        if self.delay:
+            time.sleep(self.delay)
+        status, payload = stub_response(
+            self.command, self.path, self.headers.get('Authorization', ''), body, self.fail_rate
+        )
+
+        data = json.dumps(payload).encode()
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json;charset=UTF-8')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # client가 timeout으로 먼저 연결을 끊은 경우
+            self.close_connection = True
+
+    do_GET = handle_stub
+    do_POST = handle_stub
+
+
+def run_stub_server(port: int = 0, delay: float = 0.0, fail_rate: float = 0.0,
+                    background: bool = False) -> ThreadingHTTPServer:
+    """
+    port 0이면 빈 port 사용 (server.server_port), background면 daemon thread에서 실행
+    """
+    handler = type('KakaoStubHandler', (KakaoStubHandler,), dict(delay=delay, fail_rate=fail_rate))
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    if background:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    else:
+        server.serve_forever()
+    return server
+
+
+class AsyncKakaoStubServer:
+    """
+    asyncio 기반 stub server (연결 하나당 thread를 쓰지 않으므로 동시 요청 수천 개의 지연을 흉내낼 수 있음)
+    """
+
+    def __init__(self, port: int = 0, delay: float = 0.0, fail_rate: float = 0.0):
+        self.port = port
+        self.delay = delay
+        self.fail_rate = fail_rate
+        self.server = None
+        self.loop = None
+
+    @property
+    def server_port(self) -> int:
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                lines = head.decode('latin-1').split('\r\n')
+                method, path, _ = lines[0].split(' ', 2)
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        key, value = line.split(':', 1)
+                        headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length') or 0))
+
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                status, payload = stub_response(
+                    method, path, headers.get('authorization', ''), body.decode(), self.fail_rate
+                )
+
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f'HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n'
+                    f'Content-Type: application/json;charset=UTF-8\r\n'
+                    f'Content-Length: {len(data)}\r\n\r\n'.encode() + data
+                )
+                await writer.drain()
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            # 연결 종료 / shutdown
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', self.port, backlog=4096)
+        return self
+
+    def start_background(self):
+        """
+        별도 thread의 event loop에서 실행
+        """
+        started = threading.Event()
+
+        def run():
+            loop = asyncio.new_event_loop()
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+
+        threading.Thread(target=run, daemon=True).start()
+        started.wait()
+        return self
+
+    async def stop(self):
+        self.server.close()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def shutdown(self):
+        asyncio.run_coroutine_threadsafe(self.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+async def serve_async(port: int, delay: float, fail_rate: float):
+    stub = await AsyncKakaoStubServer(port, delay, fail_rate).start()
+    async with stub.server:
+        await stub.server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--delay', type=float, default=0.0)
+    parser.add_argument('--fail-rate', type=float, default=0.0)
+    parser.add_argument('--async', dest='use_async', action='store_true')
+    args = parser.parse_args()
+    if args.use_async:
+        asyncio.run(serve_async(args.port, args.delay, args.fail_rate))
+    else:
+        run_stub_server(args.port, args.delay, args.fail_rate)
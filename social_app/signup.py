@@ -0,0 +1,22 @@
+from allauth.socialaccount.adapter import get_adapter
+from django.db import transaction
+
+from accounts.models import User, CommonProfile
+from dtos.social_app import KakaoUserOutputDTO
+
+
+def kakao_signup(request, kakao_user: KakaoUserOutputDTO) -> User:
+    """
+    kakao user 정보로 User + SocialAccount + EmailAddress + CommonProfile을 한 transaction에서 생성
+    - 이미 받은 user 정보를 사용하므로 SocialLoginView(loopback http 요청, kakao 재조회)를 거치지 않음
+    - social 전용 계정이므로 password는 hash 없이 unusable로 설정
+    """
+    provider = get_adapter(request).get_provider(request, 'kakao')
+    sociallogin = provider.sociallogin_from_response(request, kakao_user.extra_data)
+
+    user = sociallogin.user
+    user.set_unusable_password()
+    with transaction.atomic():
+        sociallogin.save(request)
+        CommonProfile.objects.create(user=user, name=kakao_user.nickname)
+    return user
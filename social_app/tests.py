@@ -0,0 +1,126 @@
+import time
+from collections import Counter
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from social_app import kakao_stub
+from social_app.kakao import KakaoClient, KakaoAPIError, KakaoUnavailableError, CircuitBreaker, \
+    KAKAO_CIRCUIT_FAILURE_THRESHOLD, KAKAO_MAX_RETRIES
+from social_app.kakao_stub import KakaoStubHandler, run_stub_server
+
+STUB_DELAY = 0.5
+READ_TIMEOUT = 0.1
+RESET_TIMEOUT = 0.2
+
+
+class KakaoClientTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ok = run_stub_server(port=0, background=True)
+        cls.slow = run_stub_server(port=0, delay=STUB_DELAY, background=True)
+        cls.down = run_stub_server(port=0, fail_rate=1.0, background=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        for server in (cls.ok, cls.slow, cls.down):
+            server.shutdown()
+            server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        # ok / down server가 받은 요청 수 (method, path)
+        # slow server는 timeout 뒤에도 응답을 마저 처리하므로 다음 test에 섞이지 않도록 세지 않음
+        self.calls = Counter()
+
+        def counted(handler):
+            self.calls[handler.command, handler.path] += 1
+            return KakaoStubHandler.handle_stub(handler)
+
+        for server in (self.ok, self.down):
+            for name in ('do_GET', 'do_POST'):
+                patcher = mock.patch.object(server.RequestHandlerClass, name, counted)
+                patcher.start()
+                self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def host(server) -> str:
+        return f'http://127.0.0.1:{server.server_port}'
+
+    def kakao_client(self, auth_server, api_server=None, **kwargs) -> KakaoClient:
+        api_server = api_server or auth_server
+        return KakaoClient(self.host(auth_server), self.host(api_server), **kwargs)
+
+    def test_read_timeout(self):
+        client = self.kakao_client(self.slow, timeout=(1, READ_TIMEOUT))
+
+        started = time.monotonic()
+        with self.assertRaises(KakaoUnavailableError):
+            client.get_token('abc')
+        self.assertLess(time.monotonic() - started, STUB_DELAY)
+
+        with self.assertRaises(KakaoUnavailableError):
+            client.get_user(kakao_stub.STUB_TOKEN_PREFIX + 'abc')
+
+    def test_retry_get_only(self):
+        client = self.kakao_client(self.down)
+
+        with self.assertRaises(KakaoUnavailableError) as ctx:
+            client.get_user(kakao_stub.STUB_TOKEN_PREFIX + 'abc')
+        self.assertEqual(ctx.exception.status_code, 503)
+        self.assertEqual(self.calls['GET', '/v2/user/me'], 1 + KAKAO_MAX_RETRIES)
+
+        # 인가 코드는 한 번만 쓸 수 있으므로 token 요청은 재시도하지 않음
+        with self.assertRaises(KakaoUnavailableError):
+            client.get_token('abc')
+        self.assertEqual(self.calls['POST', '/oauth/token'], 1)
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker(reset_timeout=RESET_TIMEOUT)
+        client = self.kakao_client(self.down, self.ok, breaker=breaker)
+        access_token = kakao_stub.STUB_TOKEN_PREFIX + 'abc'
+
+        for _ in range(KAKAO_CIRCUIT_FAILURE_THRESHOLD):
+            self.assertFalse(breaker.is_open)
+            with self.assertRaises(KakaoUnavailableError):
+                client.get_token('abc')
+        self.assertTrue(breaker.is_open)
+
+        # open인 동안은 요청을 보내지 않고 바로 실패
+        with self.assertRaises(KakaoUnavailableError) as ctx:
+            client.get_user(access_token)
+        self.assertIsNone(ctx.exception.status_code)
+        self.assertEqual(self.calls['GET', '/v2/user/me'], 0)
+
+        # half-open에서는 요청 하나만 통과, 실패하면 다시 open
+        time.sleep(RESET_TIMEOUT)
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+        self.assertFalse(breaker.allow())
+
+        # half-open 요청이 성공하면 closed
+        time.sleep(RESET_TIMEOUT)
+        self.assertEqual(client.get_user(access_token).email, 'abc@kakao.stub')
+        self.assertFalse(breaker.is_open)
+        self.assertEqual(self.calls['GET', '/v2/user/me'], 1)
+
+    def test_client_error(self):
+        client = self.kakao_client(self.ok)
+
+        with self.assertRaises(KakaoAPIError) as ctx:
+            client.get_token('invalid')
+        self.assertNotIsInstance(ctx.exception, KakaoUnavailableError)
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertEqual(ctx.exception.detail['error_code'], 'KOE320')
+
+        with self.assertRaises(KakaoAPIError) as ctx:
+            client.get_user('unknown')
+        self.assertNotIsInstance(ctx.exception, KakaoUnavailableError)
+        self.assertEqual(ctx.exception.status_code, 401)
+
+        # 4xx는 kakao 장애가 아니므로 circuit 실패로 세지 않음
+        self.assertFalse(client.breaker.is_open)
+        self.assertEqual(client.get_user(kakao_stub.STUB_TOKEN_PREFIX + 'abc').email, 'abc@kakao.stub')
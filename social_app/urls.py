@@ -1,6 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import SimpleRouter
 
+from social_app.async_views import kakao_callback, kakao_resign
 from social_app.views import KaKaoLoginViewSet, KaKaoLogin
 
 app_name = 'social'
@@ -10,6 +11,9 @@ router.register('kakao', KaKaoLoginViewSet, basename='kakao_callback')
 # router.register('apple', AppleLoginViewSet, basename='apple')
 
 urlpatterns = [
+    # ASGI로 실행할 때 사용하는 async callback / resign
+    path('kakao/async/callback/', kakao_callback, name='kakao_async_callback'),
+    path('kakao/async/resign/', kakao_resign, name='kakao_async_resign'),
     path('', include((router.urls, 'social'))),
     path(
         "kakao/login/",
@@ -1,8 +1,5 @@
-import datetime
-import random
-
-import requests
 from allauth.socialaccount.providers.kakao.views import KakaoOAuth2Adapter
+from django.db import IntegrityError, transaction
 from django.http import JsonResponse
 from django.shortcuts import redirect
 from rest_framework import viewsets, status
@@ -11,18 +8,44 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from dj_rest_auth.registration.views import SocialLoginView
-from rest_framework_simplejwt.tokens import SlidingToken
 
-from WAKe_server.settings import KAKAO_REST_API_KEY, KAKAO_CLIENT_SECRET, KAKAO_CALLBACK_URI, LOGIN_REDIRECT_URL, \
-    KAKAO_ADMIN_KEY, BASE_URL
+from WAKe_server.settings import KAKAO_REST_API_KEY, KAKAO_CALLBACK_URI, LOGIN_REDIRECT_URL
 from allauth.socialaccount.providers.kakao import views as kakao_view
 from allauth.socialaccount.providers.oauth2.client import OAuth2Client
-from accounts.models import User, CommonProfile
+from accounts.authentication import user_cache
+from accounts.tokens import CachedSlidingToken
+from accounts.models import User
 from accounts.serializers import UserSerializer, LogoutSerializer, KakaoCallbackSerializer
 from accounts.utils import token_serializer
-
-KAKAO_TOKEN_API = "https://kauth.kakao.com/oauth/token"
-KAKAO_USER_API = "https://kapi.kakao.com/v2/user/me"
+from jobs.queue import enqueue
+from social_app.jobs import unlink_kakao_account
+from social_app.kakao import kakao_client, KakaoAPIError, KakaoUnavailableError
+from social_app.signup import kakao_signup
+
+
+def login_redirect(token: dict):
+    access_token = token['access']
+    refresh_token = token['refresh']
+    res = redirect(LOGIN_REDIRECT_URL+f'?access={access_token}&refresh={refresh_token}')
+    res.set_cookie(
+        'access',
+        access_token,
+        max_age=3600 * 24 * 3,
+        domain='.zps.kr',
+        secure=True,
+        httponly=True,
+        samesite=False,
+    )
+    res.set_cookie(
+        'refresh',
+        refresh_token,
+        max_age=3600 * 24 * 3,
+        domain='.zps.kr',
+        secure=True,
+        httponly=True,
+        samesite=False,
+    )
+    return res
 
 
 class KaKaoLoginViewSet(viewsets.GenericViewSet):
@@ -40,24 +63,18 @@ class KaKaoLoginViewSet(viewsets.GenericViewSet):
         user = request.user
 
         # todo: 일단 kakao만 구현했으므로
-        kakao_uid = user.socialaccount_set.filter(provider='kakao').first().uid
+        kakao_uid = user.socialaccount_set.filter(provider='kakao').values_list('uid', flat=True).first()
         # kakao_uid = 3664195039
-        requests.post(
-            url="https://kapi.kakao.com/v1/user/unlink",
-            headers={
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Authorization": f"KakaoAK {KAKAO_ADMIN_KEY}",
-            },
-            data={
-                "target_id_type": "user_id",
-                "target_id": int(kakao_uid)
-            }
-        )
-        user.socialaccount_set.all().delete()
+        with transaction.atomic():
+            if kakao_uid is not None:
+                # kakao unlink는 응답을 기다리지 않도록 worker(manage.py run_jobs)에서 실행
+                enqueue(unlink_kakao_account, kakao_uid=int(kakao_uid))
+            user.socialaccount_set.all().delete()
 
         token_str = request.META.get('HTTP_AUTHORIZATION', '').split()[1]
-        token = SlidingToken(token_str)
+        token = CachedSlidingToken(token_str)
         token.blacklist()
+        user_cache.invalidate(user.pk)
 
         return Response(dict(message='logout succeeded'))
 
@@ -68,97 +85,26 @@ class KaKaoLoginViewSet(viewsets.GenericViewSet):
         if not code:
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
-        # kakao에 access token 발급 요청
-        data = {
-            "grant_type": "authorization_code",
-            "client_id": KAKAO_REST_API_KEY,
-            "redirect_uri": KAKAO_CALLBACK_URI,
-            "code": code,
-            "client_secret": KAKAO_CLIENT_SECRET
-        }
-        headers = {"Content-type": "application/x-www-form-urlencoded;charset=utf-8"}
-        token = requests.post(KAKAO_TOKEN_API, data=data, headers=headers).json()  # 받은 코드로 구글에 access token 요청하기
-        access_token = token['access_token']  # 받은 access token
-        if not access_token:
+        # kakao에 access token 발급 요청 후 user info 요청
+        try:
+            kakao_token = kakao_client.get_token(code)
+            kakao_user = kakao_client.get_user(kakao_token.access_token)
+        except KakaoUnavailableError:
+            return Response(status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except KakaoAPIError:
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
-        # kakao에 user info 요청
-        headers = {"Authorization": f"Bearer ${access_token}"}
-        user_information = requests.get(KAKAO_USER_API, headers=headers).json()  # 받은 access token 으로 user 정보 요청
-
-        kakao_account = user_information.get('kakao_account')
-        email = kakao_account.get('email')
-        nickname = kakao_account.get('profile').get('nickname')
-
         # 유저가 이미 디비에 있는지 확인
-        try:
-            # a. 있으면 토큰 발행
-            user = User.objects.get(email=email)
-            token = token_serializer(user)
-            access_token = token['access']
-            refresh_token = token['refresh']
-            res = redirect(LOGIN_REDIRECT_URL+f'?access={access_token}&refresh={refresh_token}')
-            res.set_cookie(
-                'access',
-                access_token,
-                max_age=3600 * 24 * 3,
-                domain='.zps.kr',
-                secure=True,
-                httponly=True,
-                samesite=False,
-            )
-            res.set_cookie(
-                'refresh',
-                refresh_token,
-                max_age=3600 * 24 * 3,
-                domain='.zps.kr',
-                secure=True,
-                httponly=True,
-                samesite=False,
-            )
-            return res
-
-        except User.DoesNotExist:
-            # b. 없으면 유저 및 프로필 생성
-            data = {"access_token": access_token, "code": code}
-            accept = requests.post(f"{BASE_URL}social/kakao/login/", data=data)
-            accept_status = accept.status_code
-            if accept_status != 200:
-                return JsonResponse({"err_msg": "failed to signin"}, status=accept_status)
-
-            timestamp = int(datetime.datetime.now().timestamp())
-            password = str(random.randint(0, timestamp))
-
-            user = User.objects.get(email=email)
-            profile = CommonProfile.objects.create(user=user, name=nickname)
-
+        user = User.objects.filter(email=kakao_user.email).first()
+        if user is None:
+            # 없으면 유저 및 프로필 생성 (loopback 요청 없이 같은 process에서)
             try:
-                user = User.objects.get(email=email)
-                token = token_serializer(user)
-                access_token = token['access']
-                refresh_token = token['refresh']
-                res = redirect(LOGIN_REDIRECT_URL+f'?access={access_token}&refresh={refresh_token}')
-                res.set_cookie(
-                    'access',
-                    access_token,
-                    max_age=3600 * 24 * 3,
-                    domain='.zps.kr',
-                    secure=True,
-                    httponly=True,
-                    samesite=False,
-                )
-                res.set_cookie(
-                    'refresh',
-                    refresh_token,
-                    max_age=3600 * 24 * 3,
-                    domain='.zps.kr',
-                    secure=True,
-                    httponly=True,
-                    samesite=False,
-                )
-                return res
-            except Exception as e:
-                return Response(status=status.HTTP_400_BAD_REQUEST)
+                user = kakao_signup(request, kakao_user)
+            except IntegrityError:
+                return JsonResponse({"err_msg": "failed to signin"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 토큰 발행
+        return login_redirect(token_serializer(user))
 
 
 class KaKaoLogin(SocialLoginView):